@@ -12,7 +12,7 @@ from urllib.parse import unquote
 import httpx
 from bs4 import BeautifulSoup
 
-from models import ScheduleSource
+from models import ScheduleSource, find_newest_file
 
 BASE_URL = "https://www.3gpp.org/ftp/Meetings_3GPP_SYNC/RAN1/Inbox/Chair_notes"
 INBOX_URL = "https://www.3gpp.org/ftp/Meetings_3GPP_SYNC/RAN1/Inbox/"
@@ -555,17 +555,10 @@ def find_local_latest_schedule(
     Uses file modification time (mtime) to determine the latest file,
     since filenames may use meeting names instead of version numbers.
     """
-    schedule_files = [
-        f
-        for ext in DOCUMENT_EXTENSIONS
-        for f in dest_dir.glob(f"*{ext}")
-        if "schedule" in f.name.lower()
-    ]
-
-    if not schedule_files:
+    latest = find_newest_file(dest_dir, DOCUMENT_EXTENSIONS, ("schedule",))
+    if latest is None:
         return None
 
-    latest = max(schedule_files, key=lambda f: f.stat().st_mtime)
     print(f"Latest local schedule (by mtime): {latest.name}")
     return latest
 
@@ -3,32 +3,57 @@
 from __future__ import annotations
 
 import json
+import os
 import re
+from collections.abc import Iterator
+from functools import lru_cache
+from itertools import cycle
 from pathlib import Path
+from string import Template
 
 from models import (
     BREAKS,
     GROUP_COLORS,
     TIME_BLOCKS,
+    GroupColor,
     Schedule,
     time_to_grid_row,
     time_to_minutes,
 )
 
 # Default color for sessions without a group header
-_DEFAULT_COLOR = {"bg": "#F3F4F6", "border": "#9CA3AF", "text": "#374151"}
+_DEFAULT_COLOR = GroupColor(bg="#F3F4F6", border="#9CA3AF", text="#374151")
+
+
+def _session_color_style(colors: GroupColor) -> str:
+    """Return the session block CSS custom properties for a color entry."""
+    return (
+        f"--session-bg:{colors.bg};"
+        f"--session-border:{colors.border};"
+        f"--session-text:{colors.text}"
+    )
+
+
+# (style, popup line) for sessions without a group header
+_UNGROUPED_PARTS = (_session_color_style(_DEFAULT_COLOR), "")
 
 # Auto-refresh interval in minutes (0 to disable)
 AUTO_REFRESH_MINUTES = 5
 
+# Grid time span (minutes since midnight) and break bar rows
+_GRID_START_MIN = time_to_minutes("08:30")
+_GRID_END_MIN = time_to_minutes("19:45")
+_BREAK_ROWS = [
+    (time_to_grid_row(b["start"]), time_to_grid_row(b["end"]), b["name"])
+    for b in BREAKS
+]
+
 
-def _assign_group_colors(sessions: list) -> dict[str, dict]:
+def _assign_group_colors(sessions: list) -> dict[str, GroupColor]:
     """Assign colors to unique group_header values from the palette."""
     headers = sorted(set(s.group_header for s in sessions if s.group_header))
-    color_map = {}
-    for i, header in enumerate(headers):
-        color_map[header] = GROUP_COLORS[i % len(GROUP_COLORS)]
-    return color_map
+    palette = cycle(GROUP_COLORS)
+    return {header: next(palette) for header in headers}
 
 
 def _natural_sort_key(s: str):
@@ -37,10 +62,18 @@ def _natural_sort_key(s: str):
     return [int(p) if p.isdigit() else p.lower() for p in parts]
 
 
-def _build_filter_data(all_sessions: list) -> str:
-    """Build filter data JSON for the session filter panel.
+def _nsort(items, key=_natural_sort_key) -> list:
+    """Sort *items* (natural order by default), skipping the sort for 0/1 items."""
+    if len(items) < 2:
+        return list(items)
+    return sorted(items, key=key)
+
+
+def _build_filter_data(all_sessions: list) -> dict:
+    """Build filter data for the session filter panel.
 
-    Returns a JSON string with:
+    Returns a dict, compacted by :func:`_compact_filter_data` and then
+    embedded as the ``filter-data`` JSON, with:
     - groups: array of {name, sessions: [{name, key, ais}]}
     - allAIs: sorted array of all unique AI values
 
@@ -51,29 +84,32 @@ def _build_filter_data(all_sessions: list) -> str:
     # 1. Build group -> session_name -> {ais: set, hasNoAI: bool}
     group_sessions: dict[str, dict[str, dict]] = {}
     for session in all_sessions:
-        group = session.group_header or ""
-        name = session.name
-        if group not in group_sessions:
-            group_sessions[group] = {}
-        if name not in group_sessions[group]:
-            group_sessions[group][name] = {"ais": set(), "hasNoAI": False}
+        by_name = group_sessions.setdefault(session.group_header or "", {})
+        info = by_name.get(session.name)
+        if info is None:
+            info = by_name[session.name] = {"ais": set(), "hasNoAI": False}
         if session.agenda_item:
-            for ai in session.agenda_item.split(","):
-                ai = ai.strip()
-                if ai:
-                    group_sessions[group][name]["ais"].add(ai)
+            info["ais"].update(
+                ai for ai in map(str.strip, session.agenda_item.split(",")) if ai
+            )
         else:
-            group_sessions[group][name]["hasNoAI"] = True
+            info["hasNoAI"] = True
 
-    # 2. Build structured data
-    all_ais: set[str] = set()
+    # 2. Natural-sort every distinct AI once and rank them, so the
+    #    per-session lists below sort on plain integers.
+    all_ais = _nsort(
+        {ai for sessions in group_sessions.values()
+         for info in sessions.values() for ai in info["ais"]}
+    )
+    ai_rank = {ai: i for i, ai in enumerate(all_ais)}
+
+    # 3. Build structured data
     groups = []
     for group_name in sorted(group_sessions.keys(), key=lambda x: (x == "", x.lower())):
         sessions_data = []
-        for sess_name in sorted(group_sessions[group_name].keys(), key=_natural_sort_key):
+        for sess_name in _nsort(group_sessions[group_name].keys()):
             info = group_sessions[group_name][sess_name]
-            ais = sorted(info["ais"], key=_natural_sort_key)
-            all_ais.update(ais)
+            ais = _nsort(info["ais"], key=ai_rank.__getitem__)
             entry: dict = {
                 "name": sess_name,
                 "key": f"{sess_name}|{group_name}",
@@ -91,13 +127,13 @@ def _build_filter_data(all_sessions: list) -> str:
             "sessions": sessions_data,
         })
 
-    result = {
+    return {
         "groups": groups,
-        "allAIs": sorted(all_ais, key=_natural_sort_key),
+        "allAIs": all_ais,
     }
-    return json.dumps(result, ensure_ascii=False)
 
 
+@lru_cache(maxsize=8)
 def _generate_css(num_rooms_max: int) -> str:
     """Generate the CSS for the schedule page."""
     return """
@@ -235,6 +271,25 @@ header .meta {
     position: relative;
 }
 
+/* 30-minute grid lines (darker on the hour), 08:30 through 19:30 */
+.schedule-grid::before {
+    content: '';
+    position: absolute;
+    top: var(--header-height);
+    left: 0;
+    right: 0;
+    height: calc(var(--slot-height) * 132 + 1px);
+    background: repeating-linear-gradient(
+        to bottom,
+        var(--grid-line) 0 1px,
+        transparent 1px calc(var(--slot-height) * 6),
+        #D1D5DB calc(var(--slot-height) * 6) calc(var(--slot-height) * 6 + 1px),
+        transparent calc(var(--slot-height) * 6 + 1px) calc(var(--slot-height) * 12)
+    );
+    pointer-events: none;
+    z-index: 1;
+}
+
 /* Room headers */
 .room-header {
     grid-row: 1;
@@ -278,18 +333,6 @@ header .meta {
     z-index: 5;
 }
 
-/* 30-minute grid lines */
-.grid-line {
-    grid-column: 1 / -1;
-    border-top: 1px solid var(--grid-line);
-    pointer-events: none;
-    z-index: 1;
-}
-
-.grid-line.major {
-    border-top: 1px solid #D1D5DB;
-}
-
 /* Break bars */
 .break-bar {
     grid-column: 1 / -1;
@@ -727,70 +770,70 @@ header .meta {
 """
 
 
-def _generate_js(timezone: str = "UTC", auto_refresh_minutes: int = AUTO_REFRESH_MINUTES) -> str:
-    """Generate the JavaScript for tab switching, today selection, now-line, and auto-refresh."""
-    auto_refresh_ms = auto_refresh_minutes * 60 * 1000
-    return f"""
-document.addEventListener('DOMContentLoaded', function() {{
-    const MEETING_TZ = '{timezone}';
-    const AUTO_REFRESH_MS = {auto_refresh_ms}; // {auto_refresh_minutes} minutes
+# Page script template.  Kept as a plain string (literal JS braces, no
+# f-string doubling) and parsed once at import; ``$name`` placeholders are
+# filled in by _generate_js.
+_JS_TEMPLATE = Template("""
+document.addEventListener('DOMContentLoaded', function() {
+    const MEETING_TZ = '$timezone';
+    const AUTO_REFRESH_MS = $auto_refresh_ms; // $auto_refresh_minutes minutes
     const STATE_KEY = '3gpp_schedule_state';
 
     // --- User state persistence (sessionStorage) ---
-    function saveUserState() {{
+    function saveUserState() {
         const activeTab = document.querySelector('.tab.active');
-        const state = {{
+        const state = {
             activeDay: activeTab ? activeTab.dataset.day : null,
             scrollX: window.scrollX,
             scrollY: window.scrollY
-        }};
-        try {{
+        };
+        try {
             sessionStorage.setItem(STATE_KEY, JSON.stringify(state));
-        }} catch (e) {{
+        } catch (e) {
             // sessionStorage may be unavailable; silently ignore
-        }}
-    }}
+        }
+    }
 
-    function loadUserState() {{
-        try {{
+    function loadUserState() {
+        try {
             const raw = sessionStorage.getItem(STATE_KEY);
             return raw ? JSON.parse(raw) : null;
-        }} catch (e) {{
+        } catch (e) {
             return null;
-        }}
-    }}
+        }
+    }
 
     // Helper: get current Date components in the meeting timezone
-    function nowInMeetingTZ() {{
+    function nowInMeetingTZ() {
         const now = new Date();
-        const fmt = new Intl.DateTimeFormat('en-US', {{
+        const fmt = new Intl.DateTimeFormat('en-US', {
             timeZone: MEETING_TZ,
             hour: 'numeric', minute: 'numeric',
             weekday: 'long',
             hour12: false
-        }});
+        });
         const parts = fmt.formatToParts(now);
         let hour = 0, minute = 0, weekday = '';
-        for (const p of parts) {{
+        for (const p of parts) {
             if (p.type === 'hour') hour = parseInt(p.value, 10);
             if (p.type === 'minute') minute = parseInt(p.value, 10);
             if (p.type === 'weekday') weekday = p.value.toLowerCase();
-        }}
-        return {{ hour, minute, weekday, minutes: hour * 60 + minute }};
-    }}
+        }
+        return { hour, minute, weekday, minutes: hour * 60 + minute };
+    }
 
     // Update the "Updated" display in meeting timezone
-    function updateTimeDisplay() {{
+    function updateTimeDisplay() {
         const el = document.getElementById('tz-now');
         if (!el) return;
         const now = new Date();
-        const formatted = now.toLocaleString('en-US', {{
+        const formatted = now.toLocaleString('en-US', {
             timeZone: MEETING_TZ,
             year: 'numeric', month: '2-digit', day: '2-digit',
             hour: '2-digit', minute: '2-digit', hour12: false
-        }});
+        });
         el.textContent = formatted;
-    }}
+    }
     updateTimeDisplay();
     setInterval(updateTimeDisplay, 60000);
 
@@ -798,63 +841,63 @@ document.addEventListener('DOMContentLoaded', function() {{
     const tabs = document.querySelectorAll('.tab');
     const panels = document.querySelectorAll('.day-panel');
 
-    tabs.forEach(tab => {{
-        tab.addEventListener('click', function() {{
+    tabs.forEach(tab => {
+        tab.addEventListener('click', function() {
             tabs.forEach(t => t.classList.remove('active'));
             panels.forEach(p => p.classList.remove('active'));
             this.classList.add('active');
             const day = this.dataset.day;
             const panel = document.getElementById(day);
             if (panel) panel.classList.add('active');
-        }});
-    }});
+        });
+    });
 
     // Restore saved state or auto-select today's tab
     const saved = loadUserState();
-    if (saved && saved.activeDay) {{
+    if (saved && saved.activeDay) {
         const savedTab = document.querySelector('[data-day="' + saved.activeDay + '"]');
-        if (savedTab) {{
+        if (savedTab) {
             savedTab.click();
             window.scrollTo(saved.scrollX || 0, saved.scrollY || 0);
-        }} else {{
+        } else {
             const firstTab = document.querySelector('.tab');
             if (firstTab) firstTab.click();
-        }}
-    }} else {{
-        const {{ weekday: today }} = nowInMeetingTZ();
-        const todayTab = document.querySelector(`[data-day="${{today}}"]`);
-        if (todayTab) {{
+        }
+    } else {
+        const { weekday: today } = nowInMeetingTZ();
+        const todayTab = document.querySelector('[data-day="' + today + '"]');
+        if (todayTab) {
             todayTab.click();
-        }} else {{
+        } else {
             const firstTab = document.querySelector('.tab');
             if (firstTab) firstTab.click();
-        }}
-    }}
+        }
+    }
 
     // Now-line: update position every minute (in meeting timezone)
     // Only show on the panel matching today's weekday
-    function updateNowLine() {{
-        const {{ minutes, weekday }} = nowInMeetingTZ();
+    function updateNowLine() {
+        const { minutes, weekday } = nowInMeetingTZ();
         const base = 8 * 60 + 30; // 08:30
         const end = 19 * 60 + 45; // 19:45
 
         document.querySelectorAll('.now-line').forEach(el => el.remove());
 
-        if (minutes >= base && minutes <= end) {{
+        if (minutes >= base && minutes <= end) {
             const slot = Math.floor((minutes - base) / 5);
             const row = slot + 2;
             const todayPanel = document.getElementById(weekday);
-            if (todayPanel) {{
+            if (todayPanel) {
                 const grid = todayPanel.querySelector('.schedule-grid');
-                if (grid) {{
+                if (grid) {
                     const nowLine = document.createElement('div');
                     nowLine.className = 'now-line';
                     nowLine.style.gridRow = row + ' / ' + (row + 1);
                     grid.appendChild(nowLine);
-                }}
-            }}
-        }}
-    }}
+                }
+            }
+        }
+    }
 
     updateNowLine();
     setInterval(updateNowLine, 60000);
@@ -865,54 +908,82 @@ document.addEventListener('DOMContentLoaded', function() {{
     const popupContent = document.getElementById('popup-content');
     const popupCloseBtn = document.getElementById('popup-close-btn');
 
-    function closePopup() {{
+    function closePopup() {
         popupEl.classList.remove('show');
         backdrop.classList.remove('active');
-    }}
-
-    document.querySelectorAll('.session-block').forEach(block => {{
-        block.addEventListener('click', function(e) {{
-            e.stopPropagation();
-            const html = this.getAttribute('data-popup');
-            if (!html) return;
-            const wasOpen = popupEl.classList.contains('show');
-            closePopup();
-            if (!wasOpen || popupContent.innerHTML !== html) {{
-                popupContent.innerHTML = html;
-                const blockRect = this.getBoundingClientRect();
-                popupEl.classList.add('show');
-                backdrop.classList.add('active');
-                // Initially place to the right of the block
-                let left = blockRect.right + 4;
-                let top = blockRect.top;
-                // Measure popup after rendering
-                const pRect = popupEl.getBoundingClientRect();
-                // Flip left if off-screen right
-                if (left + pRect.width > window.innerWidth - 8) {{
-                    left = blockRect.left - pRect.width - 4;
-                }}
-                if (left < 8) left = 8;
-                // Flip up if off-screen bottom
-                if (top + pRect.height > window.innerHeight - 8) {{
-                    top = window.innerHeight - pRect.height - 8;
-                }}
-                if (top < 8) top = 8;
-                popupEl.style.left = left + 'px';
-                popupEl.style.top = top + 'px';
-            }}
-        }});
-    }});
+    }
+
+    // One delegated listener for every session block
+    document.querySelector('.container').addEventListener('click', function(e) {
+        const block = e.target.closest('.session-block');
+        if (!block) return;
+        e.stopPropagation();
+        const html = block.getAttribute('data-popup');
+        if (!html) return;
+        const wasOpen = popupEl.classList.contains('show');
+        closePopup();
+        if (!wasOpen || popupContent.innerHTML !== html) {
+            popupContent.innerHTML = html;
+            const blockRect = block.getBoundingClientRect();
+            popupEl.classList.add('show');
+            backdrop.classList.add('active');
+            // Initially place to the right of the block
+            let left = blockRect.right + 4;
+            let top = blockRect.top;
+            // Measure popup after rendering
+            const pRect = popupEl.getBoundingClientRect();
+            // Flip left if off-screen right
+            if (left + pRect.width > window.innerWidth - 8) {
+                left = blockRect.left - pRect.width - 4;
+            }
+            if (left < 8) left = 8;
+            // Flip up if off-screen bottom
+            if (top + pRect.height > window.innerHeight - 8) {
+                top = window.innerHeight - pRect.height - 8;
+            }
+            if (top < 8) top = 8;
+            popupEl.style.left = left + 'px';
+            popupEl.style.top = top + 'px';
+        }
+    });
 
     backdrop.addEventListener('click', closePopup);
-    popupCloseBtn.addEventListener('click', function(e) {{
+    popupCloseBtn.addEventListener('click', function(e) {
         e.stopPropagation();
         closePopup();
-    }});
+    });
 
     // ── Session Filter ──
     const filterDataEl = document.getElementById('filter-data');
-    if (filterDataEl) {{
-        const FD = JSON.parse(filterDataEl.textContent);
+    if (filterDataEl) {
+        // Expand the positional filter data (see _compact_filter_data).
+        // Sessions get integer ids in flattened group order and keep their
+        // AIs as ids into allAIs, matching the generator's block-data.
+        const FD = (function(raw) {
+            var allAIs = raw[0];
+            var sessions = [];
+            return {
+                allAIs: allAIs,
+                sessions: sessions,
+                groups: raw[1].map(function(g) {
+                    var header = g[0];
+                    return {
+                        name: header || 'Other',
+                        sessions: g[1].map(function(s) {
+                            var sess = {
+                                id: sessions.length,
+                                name: s[0],
+                                key: s[0] + '|' + header,
+                                aiIds: s[1]
+                            };
+                            if (s[2]) sess.hasNoAI = true;
+                            sessions.push(sess);
+                            return sess;
+                        })
+                    };
+                })
+            };
+        })(JSON.parse(filterDataEl.textContent));
         const filterPanel = document.querySelector('.filter-panel');
         const filterToggle = document.querySelector('.filter-toggle');
         const filterClear = document.querySelector('.filter-clear');
@@ -921,61 +992,86 @@ document.addEventListener('DOMContentLoaded', function() {{
         const dimOpacityRange = document.querySelector('.filter-dim-opacity-range');
         const dimOpacityValue = document.querySelector('.filter-dim-opacity-value');
         const DIM_OPACITY_DEFAULT = 0.12;
-        // Three sets are the source of truth; group/session visual state is DERIVED.
-        const activeSessions = new Set();  // keys of sessions WITHOUT AIs
-        const activeAIs = new Set();
-        const activeNoAISessions = new Set(); // keys of sessions with AIs that also have no-AI blocks
+        // Three sets of ids are the source of truth; group/session visual state is DERIVED.
+        const activeSessions = new Set();  // ids of sessions WITHOUT AIs
+        const activeAIs = new Set();       // ids into FD.allAIs
+        const activeNoAISessions = new Set(); // ids of sessions with AIs that also have no-AI blocks
         let dimOpacity = DIM_OPACITY_DEFAULT;
 
-        function clampDimOpacity(v) {{
+        // String -> id lookups, only needed to read the URL hash
+        const aiIndex = new Map();
+        FD.allAIs.forEach(function(ai, i) { aiIndex.set(ai, i); });
+        const sessionIndex = new Map();
+        FD.sessions.forEach(function(s) { sessionIndex.set(s.key, s.id); });
+
+        // Session blocks and their filter ids are fixed after load: decode
+        // them once here instead of re-reading the DOM per filter pass.
+        const sessionBlocks = document.getElementsByClassName('session-block');
+        const blockDataEl = document.getElementById('block-data');
+        const blockData = blockDataEl ? JSON.parse(blockDataEl.textContent) : [];
+        const blockSess = new Int32Array(sessionBlocks.length);
+        const blockAiMask = new Array(sessionBlocks.length);
+        for (var bi = 0; bi < sessionBlocks.length; bi++) {
+            blockSess[bi] = blockData[bi][0];
+            blockAiMask[bi] = BigInt('0x' + blockData[bi][1]);
+        }
+        // Per-session flags rebuilt by applyFilter()
+        const sessMatch = new Uint8Array(FD.sessions.length);
+        const sessNoAI = new Uint8Array(FD.sessions.length);
+        // Dimmed state per block as last written; blocks render undimmed.
+        const blockDimmed = new Uint8Array(sessionBlocks.length);
+        const blockMatch = new Uint8Array(sessionBlocks.length);
+
+        // Checkbox references, filled in by buildFilterList()
+        let aiCheckboxes = [];     // {cb, id} for tree duplicates + flat list
+        let noAICheckboxes = [];   // {cb, id} with session ids
+        let sessionCheckboxes = [];  // by session id
+        let groupCheckboxes = [];    // by group index
+
+        function clampDimOpacity(v) {
             var n = Number(v);
             if (!isFinite(n)) return DIM_OPACITY_DEFAULT;
             if (n < 0.02) return 0.02;
             if (n > 0.95) return 0.95;
             return Math.round(n * 100) / 100;
-        }}
+        }
 
-        function setDimOpacity(v) {{
+        function setDimOpacity(v) {
             dimOpacity = clampDimOpacity(v);
             document.documentElement.style.setProperty('--dim-opacity', String(dimOpacity));
             if (dimOpacityRange) dimOpacityRange.value = String(dimOpacity);
             if (dimOpacityValue) dimOpacityValue.textContent = Math.round(dimOpacity * 100) + '%';
-        }}
-
-        // --- helpers to look up FD ---
-        function findGroup(key) {{ return FD.groups.find(function(g){{ return g.key===key; }}); }}
-        function findSess(key) {{
-            var out = null;
-            FD.groups.forEach(function(g){{ g.sessions.forEach(function(s){{ if(s.key===key) out=s; }}); }});
-            return out;
-        }}
-
-        function mkEl(tag, cls) {{ const e = document.createElement(tag); if (cls) e.className = cls; return e; }}
-        function mkSpacer() {{ const s = document.createElement('span'); s.style.width='16px'; s.style.flexShrink='0'; return s; }}
-        function mkToggle(container) {{
+        }
+
+        function mkEl(tag, cls) { const e = document.createElement(tag); if (cls) e.className = cls; return e; }
+        function mkSpacer() { const s = document.createElement('span'); s.style.width='16px'; s.style.flexShrink='0'; return s; }
+        function mkToggle(container) {
             const btn = mkEl('button','tree-toggle');
             btn.textContent = '\u25B6';
-            btn.addEventListener('click', function(e) {{
+            btn.addEventListener('click', function(e) {
                 e.stopPropagation();
                 const ch = container.querySelector(':scope > .filter-children');
                 if (!ch) return;
                 const exp = ch.classList.toggle('expanded');
                 btn.textContent = exp ? '\u25BC' : '\u25B6';
-            }});
+            });
             return btn;
-        }}
+        }
 
-        function buildFilterList() {{
+        function buildFilterList() {
             filterList.innerHTML = '';
+            aiCheckboxes = []; noAICheckboxes = [];
+            sessionCheckboxes = []; groupCheckboxes = [];
             // --- Group trees ---
-            FD.groups.forEach(function(group, gi) {{
+            FD.groups.forEach(function(group, gi) {
                 const grpDiv = mkEl('div','filter-group');
                 // Group header row
                 const grpRow = mkEl('div','filter-item');
                 grpRow.appendChild(mkToggle(grpDiv));
                 const gcb = document.createElement('input');
-                gcb.type = 'checkbox'; gcb.id = 'fg'+gi; gcb.dataset.gk = group.key;
-                gcb.addEventListener('change', function() {{ onGroupChange(group.key, gcb.checked); }});
+                gcb.type = 'checkbox'; gcb.id = 'fg'+gi;
+                gcb.addEventListener('change', function() { onGroupChange(group, gcb.checked); });
+                groupCheckboxes[gi] = gcb;
                 grpRow.appendChild(gcb);
                 const gl = document.createElement('label'); gl.htmlFor = gcb.id;
                 gl.textContent = group.name; gl.title = group.name;
@@ -984,17 +1080,18 @@ document.addEventListener('DOMContentLoaded', function() {{
 
                 // Sessions under this group
                 const sessC = mkEl('div','filter-children');
-                group.sessions.forEach(function(sess, si) {{
+                group.sessions.forEach(function(sess, si) {
                     const sessWrap = mkEl('div','filter-group');
                     const sessRow = mkEl('div','filter-item');
-                    if (sess.ais.length > 0) {{
+                    if (sess.aiIds.length > 0) {
                         sessRow.appendChild(mkToggle(sessWrap));
-                    }} else {{
+                    } else {
                         sessRow.appendChild(mkSpacer());
-                    }}
+                    }
                     const scb = document.createElement('input');
-                    scb.type = 'checkbox'; scb.id = 'fs'+gi+'_'+si; scb.dataset.sk = sess.key;
-                    scb.addEventListener('change', function() {{ onSessionChange(sess.key, scb.checked); }});
+                    scb.type = 'checkbox'; scb.id = 'fs'+gi+'_'+si;
+                    scb.addEventListener('change', function() { onSessionChange(sess, scb.checked); });
+                    sessionCheckboxes[sess.id] = scb;
                     sessRow.appendChild(scb);
                     const sl = document.createElement('label'); sl.htmlFor = scb.id;
                     sl.textContent = sess.name; sl.title = sess.name;
@@ -1002,308 +1099,371 @@ document.addEventListener('DOMContentLoaded', function() {{
                     sessWrap.appendChild(sessRow);
 
                     // AIs under this session
-                    if (sess.ais.length > 0) {{
+                    if (sess.aiIds.length > 0) {
                         const aiC = mkEl('div','filter-children');
-                        sess.ais.forEach(function(ai, ai_i) {{
+                        sess.aiIds.forEach(function(aiId, ai_i) {
+                            const ai = FD.allAIs[aiId];
                             const aiRow = mkEl('div','filter-item');
                             aiRow.appendChild(mkSpacer());
                             const acb = document.createElement('input');
-                            acb.type = 'checkbox'; acb.id = 'fsa'+gi+'_'+si+'_'+ai_i; acb.dataset.ai = ai;
-                            acb.addEventListener('change', function() {{ onAIChange(ai, acb.checked); }});
+                            acb.type = 'checkbox'; acb.id = 'fsa'+gi+'_'+si+'_'+ai_i;
+                            acb.addEventListener('change', function() { onAIChange(aiId, acb.checked); });
+                            aiCheckboxes.push({cb: acb, id: aiId});
                             aiRow.appendChild(acb);
                             const al = document.createElement('label'); al.htmlFor = acb.id;
                             al.textContent = 'AI '+ai;
                             aiRow.appendChild(al);
                             aiC.appendChild(aiRow);
-                        }});
+                        });
                         // "Not assigned" entry for sessions that have AI-less blocks
-                        if (sess.hasNoAI) {{
+                        if (sess.hasNoAI) {
                             const naRow = mkEl('div','filter-item');
                             naRow.appendChild(mkSpacer());
                             const nacb = document.createElement('input');
                             nacb.type = 'checkbox'; nacb.id = 'fsna'+gi+'_'+si;
-                            nacb.dataset.noai = sess.key;
-                            nacb.addEventListener('change', function() {{ onNoAIChange(sess.key, nacb.checked); }});
+                            nacb.addEventListener('change', function() { onNoAIChange(sess.id, nacb.checked); });
+                            noAICheckboxes.push({cb: nacb, id: sess.id});
                             naRow.appendChild(nacb);
                             const nal = document.createElement('label'); nal.htmlFor = nacb.id;
                             nal.textContent = 'Not assigned';
                             naRow.appendChild(nal);
                             aiC.appendChild(naRow);
-                        }}
+                        }
                         sessWrap.appendChild(aiC);
-                    }}
+                    }
                     sessC.appendChild(sessWrap);
-                }});
+                });
                 grpDiv.appendChild(sessC);
                 filterList.appendChild(grpDiv);
-            }});
+            });
 
             // --- Separator + flat AI list ---
-            if (FD.allAIs.length > 0) {{
+            if (FD.allAIs.length > 0) {
                 const sep = mkEl('div','filter-separator');
                 sep.textContent = '\u2500\u2500 AI \u2500\u2500';
                 filterList.appendChild(sep);
-                FD.allAIs.forEach(function(ai, i) {{
+                FD.allAIs.forEach(function(ai, i) {
                     const row = mkEl('div','filter-item');
                     row.appendChild(mkSpacer());
                     const cb = document.createElement('input');
-                    cb.type = 'checkbox'; cb.id = 'fa'+i; cb.dataset.ai = ai;
-                    cb.addEventListener('change', function() {{ onAIChange(ai, cb.checked); }});
+                    cb.type = 'checkbox'; cb.id = 'fa'+i;
+                    cb.addEventListener('change', function() { onAIChange(i, cb.checked); });
+                    aiCheckboxes.push({cb: cb, id: i});
                     row.appendChild(cb);
                     const lb = document.createElement('label'); lb.htmlFor = cb.id;
                     lb.textContent = 'AI '+ai;
                     row.appendChild(lb);
                     filterList.appendChild(row);
-                }});
-            }}
-        }}
+                });
+            }
+        }
 
         // ── Cascade handlers ──
 
         // Group click → cascade to all child sessions → AIs + noAI
-        function onGroupChange(key, checked) {{
-            var group = findGroup(key);
-            if (!group) return;
-            group.sessions.forEach(function(sess) {{
-                if (sess.ais.length > 0) {{
-                    sess.ais.forEach(function(ai) {{
+        function onGroupChange(group, checked) {
+            group.sessions.forEach(function(sess) {
+                if (sess.aiIds.length > 0) {
+                    sess.aiIds.forEach(function(ai) {
                         if (checked) activeAIs.add(ai); else activeAIs.delete(ai);
-                    }});
-                    if (sess.hasNoAI) {{
-                        if (checked) activeNoAISessions.add(sess.key); else activeNoAISessions.delete(sess.key);
-                    }}
-                }} else {{
-                    if (checked) activeSessions.add(sess.key); else activeSessions.delete(sess.key);
-                }}
-            }});
+                    });
+                    if (sess.hasNoAI) {
+                        if (checked) activeNoAISessions.add(sess.id); else activeNoAISessions.delete(sess.id);
+                    }
+                } else {
+                    if (checked) activeSessions.add(sess.id); else activeSessions.delete(sess.id);
+                }
+            });
             syncCheckboxes(); applyFilter(); updateFilterHash();
-        }}
+        }
 
         // Session click → cascade to child AIs + noAI
-        function onSessionChange(key, checked) {{
-            var sess = findSess(key);
-            if (!sess) return;
-            if (sess.ais.length > 0) {{
-                sess.ais.forEach(function(ai) {{
+        function onSessionChange(sess, checked) {
+            if (sess.aiIds.length > 0) {
+                sess.aiIds.forEach(function(ai) {
                     if (checked) activeAIs.add(ai); else activeAIs.delete(ai);
-                }});
-                if (sess.hasNoAI) {{
-                    if (checked) activeNoAISessions.add(key); else activeNoAISessions.delete(key);
-                }}
-            }} else {{
-                if (checked) activeSessions.add(key); else activeSessions.delete(key);
-            }}
+                });
+                if (sess.hasNoAI) {
+                    if (checked) activeNoAISessions.add(sess.id); else activeNoAISessions.delete(sess.id);
+                }
+            } else {
+                if (checked) activeSessions.add(sess.id); else activeSessions.delete(sess.id);
+            }
             syncCheckboxes(); applyFilter(); updateFilterHash();
-        }}
+        }
 
         // AI click → just toggle the AI; parents derive visually
-        function onAIChange(ai, checked) {{
+        function onAIChange(ai, checked) {
             if (checked) activeAIs.add(ai); else activeAIs.delete(ai);
             syncCheckboxes(); applyFilter(); updateFilterHash();
-        }}
+        }
 
         // "Not assigned" click → toggle the session's no-AI flag
-        function onNoAIChange(sessKey, checked) {{
-            if (checked) activeNoAISessions.add(sessKey); else activeNoAISessions.delete(sessKey);
+        function onNoAIChange(sessId, checked) {
+            if (checked) activeNoAISessions.add(sessId); else activeNoAISessions.delete(sessId);
             syncCheckboxes(); applyFilter(); updateFilterHash();
-        }}
+        }
 
         // ── Derive visual state from activeAIs + activeSessions + activeNoAISessions ──
-        function syncCheckboxes() {{
+        function syncCheckboxes() {
             // 1. Sync all AI checkboxes (tree duplicates + flat list)
-            document.querySelectorAll('input[data-ai]').forEach(function(cb) {{
-                cb.checked = activeAIs.has(cb.dataset.ai);
-            }});
+            aiCheckboxes.forEach(function(ref) {
+                ref.cb.checked = activeAIs.has(ref.id);
+            });
 
             // 1b. Sync "Not assigned" checkboxes
-            document.querySelectorAll('input[data-noai]').forEach(function(cb) {{
-                cb.checked = activeNoAISessions.has(cb.dataset.noai);
-            }});
+            noAICheckboxes.forEach(function(ref) {
+                ref.cb.checked = activeNoAISessions.has(ref.id);
+            });
 
             // 2. Session checkboxes: derive from children
-            FD.groups.forEach(function(group) {{
-                group.sessions.forEach(function(sess) {{
-                    var scb = document.querySelector('input[data-sk="' + sess.key + '"]');
-                    if (!scb) return;
-                    if (sess.ais.length > 0) {{
-                        var n = 0;
-                        sess.ais.forEach(function(ai) {{ if (activeAIs.has(ai)) n++; }});
-                        var totalChildren = sess.ais.length;
-                        var checkedChildren = n;
-                        if (sess.hasNoAI) {{
-                            totalChildren++;
-                            if (activeNoAISessions.has(sess.key)) checkedChildren++;
-                        }}
-                        scb.checked = (checkedChildren === totalChildren);
-                        scb.indeterminate = (checkedChildren > 0 && checkedChildren < totalChildren);
-                    }} else {{
-                        scb.checked = activeSessions.has(sess.key);
-                        scb.indeterminate = false;
-                    }}
-                }});
-            }});
+            FD.sessions.forEach(function(sess) {
+                var scb = sessionCheckboxes[sess.id];
+                if (!scb) return;
+                if (sess.aiIds.length > 0) {
+                    var n = 0;
+                    sess.aiIds.forEach(function(ai) { if (activeAIs.has(ai)) n++; });
+                    var totalChildren = sess.aiIds.length;
+                    var checkedChildren = n;
+                    if (sess.hasNoAI) {
+                        totalChildren++;
+                        if (activeNoAISessions.has(sess.id)) checkedChildren++;
+                    }
+                    scb.checked = (checkedChildren === totalChildren);
+                    scb.indeterminate = (checkedChildren > 0 && checkedChildren < totalChildren);
+                } else {
+                    scb.checked = activeSessions.has(sess.id);
+                    scb.indeterminate = false;
+                }
+            });
 
             // 3. Group checkboxes: derive from child sessions
-            FD.groups.forEach(function(group) {{
-                var gcb = document.querySelector('input[data-gk="' + group.key + '"]');
+            FD.groups.forEach(function(group, gi) {
+                var gcb = groupCheckboxes[gi];
                 if (!gcb) return;
                 var total = group.sessions.length;
-                if (total === 0) {{ gcb.checked = false; gcb.indeterminate = false; return; }}
+                if (total === 0) { gcb.checked = false; gcb.indeterminate = false; return; }
                 var full = 0, partial = 0;
-                group.sessions.forEach(function(sess) {{
-                    var scb = document.querySelector('input[data-sk="' + sess.key + '"]');
+                group.sessions.forEach(function(sess) {
+                    var scb = sessionCheckboxes[sess.id];
                     if (!scb) return;
                     if (scb.checked) full++;
                     else if (scb.indeterminate) partial++;
-                }});
+                });
                 gcb.checked = (full === total);
                 gcb.indeterminate = (!gcb.checked && (full > 0 || partial > 0));
-            }});
+            });
 
             // 4. Badge count
             var total = activeAIs.size + activeSessions.size + activeNoAISessions.size;
-            if (filterCount) {{ filterCount.textContent = total > 0 ? total : ''; }}
-        }}
+            if (filterCount) { filterCount.textContent = total > 0 ? total : ''; }
+        }
 
-        function applyFilter() {{
+        function applyFilter() {
             var hasFilter = activeAIs.size > 0 || activeSessions.size > 0 || activeNoAISessions.size > 0;
-            // Derive session keys for sessions whose ALL AIs (+ noAI) are active.
-            // This ensures blocks without data-ai still match when the
-            // session (or parent group) checkbox is fully checked.
-            var derivedKeys = new Set(activeSessions);
-            if (activeAIs.size > 0) {{
-                FD.groups.forEach(function(group) {{
-                    group.sessions.forEach(function(sess) {{
-                        if (sess.ais.length > 0 && sess.ais.every(function(ai) {{ return activeAIs.has(ai); }})) {{
-                            if (!sess.hasNoAI || activeNoAISessions.has(sess.key)) {{
-                                derivedKeys.add(sess.key);
-                            }}
-                        }}
-                    }});
-                }});
-            }}
-            document.querySelectorAll('.session-block').forEach(function(block) {{
-                if (!hasFilter) {{ block.classList.remove('dimmed'); return; }}
-                var grp = block.getAttribute('data-group') || '';
-                var nm  = block.getAttribute('data-name') || '';
-                var raw = block.getAttribute('data-ai') || '';
-                var aiVals = raw.split('|').filter(function(v){{ return v.trim(); }});
-                var sessKey = nm + '|' + grp;
-                var match = derivedKeys.has(sessKey) ||
-                            aiVals.some(function(v){{ return activeAIs.has(v); }});
-                // Also match blocks with no AI if "Not assigned" is active for this session
-                if (!match && aiVals.length === 0 && activeNoAISessions.has(sessKey)) {{
-                    match = true;
-                }}
-                if (match) {{ block.classList.remove('dimmed'); }} else {{ block.classList.add('dimmed'); }}
-            }});
-        }}
-
-        // URL hash: s:key, a:val, n:sessKey (noAI), o:dimOpacity
-        function updateFilterHash() {{
+            // Matching sessions: active ones plus those whose ALL AIs (+ noAI)
+            // are active. This ensures blocks without AIs still match
+            // when the session (or parent group) checkbox is fully checked.
+            sessMatch.fill(0);
+            activeSessions.forEach(function(id) { sessMatch[id] = 1; });
+            if (activeAIs.size > 0) {
+                FD.sessions.forEach(function(sess) {
+                    if (sess.aiIds.length > 0 && sess.aiIds.every(function(ai) { return activeAIs.has(ai); })) {
+                        if (!sess.hasNoAI || activeNoAISessions.has(sess.id)) {
+                            sessMatch[sess.id] = 1;
+                        }
+                    }
+                });
+            }
+            var activeAiMask = 0n;
+            activeAIs.forEach(function(id) { activeAiMask |= 1n << BigInt(id); });
+            sessNoAI.fill(0);
+            activeNoAISessions.forEach(function(id) { sessNoAI[id] = 1; });
+            // Pass 1: compute matches without touching the DOM
+            for (var i = 0; i < sessionBlocks.length; i++) {
+                if (!hasFilter) { blockMatch[i] = 1; continue; }
+                var s = blockSess[i];
+                var mask = blockAiMask[i];
+                // Blocks with no AI match if "Not assigned" is active for their session
+                var match = sessMatch[s] === 1 ||
+                            (mask !== 0n ? (mask & activeAiMask) !== 0n : sessNoAI[s] === 1);
+                blockMatch[i] = match ? 1 : 0;
+            }
+            // Pass 2: write only the blocks whose dimmed state flips
+            for (var j = 0; j < sessionBlocks.length; j++) {
+                var dim = blockMatch[j] ? 0 : 1;
+                if (dim !== blockDimmed[j]) {
+                    sessionBlocks[j].classList.toggle('dimmed', dim === 1);
+                    blockDimmed[j] = dim;
+                }
+            }
+        }
+
+        // URL hash: s:key, a:val, n:sessKey (noAI), o:dimOpacity.
+        // Writes are coalesced to one per frame (slider drags, rapid clicks).
+        let hashUpdatePending = false;
+        function updateFilterHash() {
+            if (hashUpdatePending) return;
+            hashUpdatePending = true;
+            requestAnimationFrame(function() {
+                hashUpdatePending = false;
+                writeFilterHash();
+            });
+        }
+
+        function writeFilterHash() {
             var parts = [];
-            activeSessions.forEach(function(v){{ parts.push('s:'+encodeURIComponent(v)); }});
-            activeAIs.forEach(function(v){{ parts.push('a:'+encodeURIComponent(v)); }});
-            activeNoAISessions.forEach(function(v){{ parts.push('n:'+encodeURIComponent(v)); }});
-            if (Math.abs(dimOpacity - DIM_OPACITY_DEFAULT) > 0.0001) {{
+            activeSessions.forEach(function(id){ parts.push('s:'+encodeURIComponent(FD.sessions[id].key)); });
+            activeAIs.forEach(function(id){ parts.push('a:'+encodeURIComponent(FD.allAIs[id])); });
+            activeNoAISessions.forEach(function(id){ parts.push('n:'+encodeURIComponent(FD.sessions[id].key)); });
+            if (Math.abs(dimOpacity - DIM_OPACITY_DEFAULT) > 0.0001) {
                 parts.push('o:' + encodeURIComponent(dimOpacity.toFixed(2)));
-            }}
-            if (parts.length === 0) {{
+            }
+            if (parts.length === 0) {
                 history.replaceState(null, '', location.pathname + location.search);
-            }} else {{
+            } else {
                 history.replaceState(null, '', '#filter=' + parts.join(','));
-            }}
-        }}
+            }
+        }
 
-        function loadFilterHash() {{
+        function loadFilterHash() {
             var h = location.hash;
             if (!h || !h.startsWith('#filter=')) return;
-            h.slice(8).split(',').forEach(function(tok) {{
+            h.slice(8).split(',').forEach(function(tok) {
                 var c = tok.indexOf(':');
                 if (c < 0) return;
                 var type = tok.slice(0, c);
                 var val  = decodeURIComponent(tok.slice(c+1));
                 if (!val) return;
-                if (type === 's') activeSessions.add(val);
-                else if (type === 'a') activeAIs.add(val);
-                else if (type === 'n') activeNoAISessions.add(val);
+                // Keys not on this page (e.g. from an older schedule) are dropped
+                var id;
+                if (type === 's') { id = sessionIndex.get(val); if (id !== undefined) activeSessions.add(id); }
+                else if (type === 'a') { id = aiIndex.get(val); if (id !== undefined) activeAIs.add(id); }
+                else if (type === 'n') { id = sessionIndex.get(val); if (id !== undefined) activeNoAISessions.add(id); }
                 else if (type === 'o') setDimOpacity(val);
-            }});
+            });
             syncCheckboxes();
             applyFilter();
             // Auto-expand trees with active items
-            filterList.querySelectorAll('.filter-group').forEach(function(grpEl) {{
+            filterList.querySelectorAll('.filter-group').forEach(function(grpEl) {
                 var ch = grpEl.querySelector(':scope > .filter-children');
                 if (!ch) return;
                 var hasActive = ch.querySelector('input:checked') || ch.querySelector('input:indeterminate');
-                if (hasActive) {{
+                if (hasActive) {
                     ch.classList.add('expanded');
                     var tog = grpEl.querySelector(':scope > .filter-item > .tree-toggle');
                     if (tog) tog.textContent = '\u25BC';
-                }}
-            }});
-        }}
+                }
+            });
+        }
 
         // Panel toggle
-        filterToggle.addEventListener('click', function() {{
+        filterToggle.addEventListener('click', function() {
             var collapsed = filterPanel.classList.toggle('collapsed');
             filterToggle.textContent = collapsed ? '\u25C0 Filter' : '\u25B6';
-            try {{ sessionStorage.setItem('3gpp_filter_panel', collapsed ? 'c' : 'o'); }} catch(e) {{}}
-        }});
+            try { sessionStorage.setItem('3gpp_filter_panel', collapsed ? 'c' : 'o'); } catch(e) {}
+        });
 
         // Restore panel state
-        try {{
-            if (sessionStorage.getItem('3gpp_filter_panel') === 'o') {{
+        try {
+            if (sessionStorage.getItem('3gpp_filter_panel') === 'o') {
                 filterPanel.classList.remove('collapsed');
                 filterToggle.textContent = '\u25B6';
-            }}
-        }} catch(e) {{}}
+            }
+        } catch(e) {}
 
         // Clear all
-        filterClear.addEventListener('click', function() {{
+        filterClear.addEventListener('click', function() {
             activeSessions.clear(); activeAIs.clear(); activeNoAISessions.clear();
             syncCheckboxes(); applyFilter(); updateFilterHash();
-        }});
+        });
 
-        if (dimOpacityRange) {{
-            dimOpacityRange.addEventListener('input', function() {{
+        if (dimOpacityRange) {
+            dimOpacityRange.addEventListener('input', function() {
                 setDimOpacity(dimOpacityRange.value);
                 updateFilterHash();
-            }});
-        }}
+            });
+        }
 
         buildFilterList();
         setDimOpacity(DIM_OPACITY_DEFAULT);
         loadFilterHash();
-    }}
+    }
 
     // --- Auto-refresh: reload page periodically, preserving user state ---
-    if (AUTO_REFRESH_MS > 0) {{
-        setInterval(function() {{
+    if (AUTO_REFRESH_MS > 0) {
+        setInterval(function() {
             saveUserState();
             location.reload();
-        }}, AUTO_REFRESH_MS);
-    }}
-}});
+        }, AUTO_REFRESH_MS);
+    }
+});
 """
+)
 
 
-def generate_html(schedule: Schedule) -> str:
-    """Generate the complete HTML page for the schedule."""
+@lru_cache(maxsize=8)
+def _generate_js(timezone: str = "UTC", auto_refresh_minutes: int = AUTO_REFRESH_MINUTES) -> str:
+    """Generate the JavaScript for tab switching, today selection, now-line, and auto-refresh."""
+    return _JS_TEMPLATE.substitute(
+        timezone=timezone,
+        auto_refresh_ms=auto_refresh_minutes * 60 * 1000,
+        auto_refresh_minutes=auto_refresh_minutes,
+    )
+
+
+def _compact_filter_data(filter_data: dict) -> list:
+    """Pack filter data into the positional form embedded in the page.
+
+    ``[allAIs, [[group_header, [[session_name, [ai_index, ...], hasNoAI], ...]], ...]]``
+    where each ai_index points into allAIs and an empty group_header is the
+    "Other" group.  The page script expands it back to the dict shape
+    returned by :func:`_build_filter_data`.
+    """
+    ai_index = {ai: i for i, ai in enumerate(filter_data["allAIs"])}
+    groups = []
+    for group in filter_data["groups"]:
+        header = "" if group["key"] == "__other__" else group["key"]
+        groups.append([
+            header,
+            [
+                [sess["name"], [ai_index[ai] for ai in sess["ais"]], int(sess.get("hasNoAI", False))]
+                for sess in group["sessions"]
+            ],
+        ])
+    return [filter_data["allAIs"], groups]
+
+
+def _iter_html(schedule: Schedule) -> Iterator[str]:
+    """Yield the HTML page for the schedule fragment by fragment."""
     all_sessions = []
     for day in schedule.days:
         all_sessions.extend(day.sessions)
 
     color_map = _assign_group_colors(all_sessions)
-    filter_data_json = _build_filter_data(all_sessions)
+    filter_data = _build_filter_data(all_sessions)
+    filter_data_json = json.dumps(
+        _compact_filter_data(filter_data), ensure_ascii=False, separators=(",", ":")
+    )
+
+    # Integer ids for the JS filter: AIs by position in allAIs, sessions by
+    # position in the flattened group/session order of the filter data.
+    ai_index = {ai: i for i, ai in enumerate(filter_data["allAIs"])}
+    session_index = {
+        sess["key"]: i
+        for i, sess in enumerate(
+            s for group in filter_data["groups"] for s in group["sessions"]
+        )
+    }
+    # Per-block [session id, hex AI bitmask], in document order
+    block_data = []
     mailto_link = _esc(f"mailto:{schedule.contact_email}")
 
     # Join multiple source files if available
     sources_text = ", ".join(schedule.source_files) if getattr(schedule, 'source_files', []) else schedule.source_file
 
     # Build HTML
-    html_parts = []
-    html_parts.append(f"""<!DOCTYPE html>
+    yield f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -1318,237 +1478,258 @@ def generate_html(schedule: Schedule) -> str:
         <p class="meta">Updated Files: {_esc(sources_text)} &nbsp;|&nbsp; Generated: {_esc(schedule.generated_at)} ({_esc(schedule.timezone)}) &nbsp;|&nbsp; Now: <span id="tz-now">...</span> ({_esc(schedule.timezone)})</p>
         <p class="meta">Contact: {_esc(schedule.contact_name)} (<a href="{mailto_link}">{_esc(schedule.contact_email)}</a>) for reports or feature requests.</p>
     </header>
-""")
+"""
 
     # Legend (group headers)
     if color_map:
-        html_parts.append('    <div class="legend">\n')
+        yield '    <div class="legend">\n'
         for header, colors in sorted(color_map.items()):
-            html_parts.append(
+            yield (
                 f'        <div class="legend-item">'
-                f'<span class="legend-swatch" style="background:{colors["bg"]};border-color:{colors["border"]}"></span>'
+                f'<span class="legend-swatch" style="background:{colors.bg};border-color:{colors.border}"></span>'
                 f'{_esc(header)}</div>\n'
             )
-        html_parts.append("    </div>\n")
+        yield "    </div>\n"
 
     # Day tabs
-    html_parts.append('    <div class="tabs">\n')
+    yield '    <div class="tabs">\n'
     for day_schedule in schedule.days:
         day_lower = day_schedule.day_name.lower()
         day_short = day_schedule.day_name[:3]
-        html_parts.append(
+        yield (
             f'        <button class="tab" data-day="{day_lower}">{day_short}</button>\n'
         )
-    html_parts.append("    </div>\n")
+    yield "    </div>\n"
+
+    grid_scaffold_html = _grid_scaffold_html()
+    # Per-group (style, popup line), computed once per page
+    group_parts = {
+        header: (_session_color_style(colors), f"Group: {_esc(header)}")
+        for header, colors in color_map.items()
+    }
 
     # Day panels
     for day_schedule in schedule.days:
-        day_lower = day_schedule.day_name.lower()
-        num_rooms = len(day_schedule.rooms)
-        if num_rooms == 0:
+        if not day_schedule.rooms:
             continue
+        panel_html, block_rows = _day_panel_html(
+            day_schedule, group_parts, grid_scaffold_html, ai_index, session_index
+        )
+        yield panel_html
+        block_data.extend(block_rows)
 
-        # Grid template columns
-        col_template = f"var(--time-col-width) repeat({num_rooms}, 1fr)"
+    # Shared floating popup and backdrop
+    yield '    <div class="popup-backdrop" id="popup-backdrop"></div>\n'
+    yield '    <div class="popup-floating" id="popup-floating"><div id="popup-content"></div><button class="popup-close" id="popup-close-btn">&times;</button></div>\n'
 
-        html_parts.append(
-            f'    <div class="day-panel" id="{day_lower}">\n'
-            f'        <div class="grid-wrapper">\n'
-            f'            <div class="schedule-grid" '
-            f'style="grid-template-columns: {col_template}">\n'
-        )
+    # Filter panel
+    yield '    <div class="filter-panel collapsed">\n'
+    yield '        <button class="filter-toggle">&#9664; Filter</button>\n'
+    yield '        <div class="filter-header"><span>Session Filter <span class="filter-active-count"></span></span><button class="filter-clear">Clear</button></div>\n'
+    yield '        <div class="filter-controls"><label for="filter-dim-opacity-range">Unchecked opacity</label><div class="filter-dim-opacity"><input type="range" id="filter-dim-opacity-range" class="filter-dim-opacity-range" min="0.02" max="0.95" step="0.01" value="0.12"><span class="filter-dim-opacity-value">12%</span></div></div>\n'
+    yield '        <div class="filter-list"></div>\n'
+    yield '    </div>\n'
 
-        # Room headers
-        html_parts.append(
-            '                <div class="room-header time-col" '
-            'style="grid-column:1;grid-row:1">Time</div>\n'
+    # Filter data (JSON, read by JS)
+    yield f'    <script type="application/json" id="filter-data">{filter_data_json}</script>\n'
+    yield f'    <script type="application/json" id="block-data">{json.dumps(block_data, separators=(",", ":"))}</script>\n'
+
+    # Close container and add JS
+    yield f"""</div>
+<script>{_generate_js(schedule.timezone)}</script>
+</body>
+</html>"""
+
+
+def generate_html(schedule: Schedule) -> str:
+    """Generate the complete HTML page for the schedule."""
+    return "".join(_iter_html(schedule))
+
+
+def _day_panel_html(
+    day_schedule,
+    group_parts: dict[str, tuple[str, str]],
+    grid_scaffold_html: str,
+    ai_index: dict[str, int],
+    session_index: dict[str, int],
+) -> tuple[str, list]:
+    """Render one day's panel; return its HTML and its block-data rows.
+
+    The day must have at least one room.
+    """
+    day_lower = day_schedule.day_name.lower()
+    num_rooms = len(day_schedule.rooms)
+    parts = []
+    block_rows = []
+
+    # Grid template columns
+    col_template = f"var(--time-col-width) repeat({num_rooms}, 1fr)"
+
+    parts.append(
+        f'    <div class="day-panel" id="{day_lower}">\n'
+        f'        <div class="grid-wrapper">\n'
+        f'            <div class="schedule-grid" '
+        f'style="grid-template-columns: {col_template}">\n'
+    )
+
+    # Room headers
+    parts.append(
+        '                <div class="room-header time-col" '
+        'style="grid-column:1;grid-row:1">Time</div>\n'
+    )
+    for ri, room in enumerate(day_schedule.rooms):
+        col = ri + 2
+        parts.append(
+            f'                <div class="room-header" '
+            f'style="grid-column:{col};grid-row:1">{_esc(room.name)}</div>\n'
         )
-        for ri, room in enumerate(day_schedule.rooms):
-            col = ri + 2
-            html_parts.append(
-                f'                <div class="room-header" '
-                f'style="grid-column:{col};grid-row:1">{_esc(room.name)}</div>\n'
-            )
 
-        # Time labels at 30-minute intervals
-        time_min = time_to_minutes("08:30")
-        end_min = time_to_minutes("19:45")
-        while time_min <= end_min:
-            row = (time_min - time_to_minutes("08:30")) // 5 + 2
-            t_str = f"{time_min // 60:02d}:{time_min % 60:02d}"
-            # Only show labels at 30-min intervals
-            if time_min % 30 == 0:
-                html_parts.append(
-                    f'                <div class="time-label" '
-                    f'style="grid-row:{row}/{row + 6}">{t_str}</div>\n'
-                )
-            time_min += 30
-
-        # Grid lines every 30 minutes
-        time_min = time_to_minutes("08:30")
-        while time_min <= end_min:
-            row = (time_min - time_to_minutes("08:30")) // 5 + 2
-            major = " major" if time_min % 60 == 0 else ""
-            html_parts.append(
-                f'                <div class="grid-line{major}" '
-                f'style="grid-row:{row}"></div>\n'
-            )
-            time_min += 30
-
-        # Break bars
-        for brk in BREAKS:
-            row_start = time_to_grid_row(brk["start"])
-            row_end = time_to_grid_row(brk["end"])
-            html_parts.append(
-                f'                <div class="break-bar" '
-                f'style="grid-row:{row_start}/{row_end}">'
-                f'{_esc(brk["name"])}</div>\n'
-            )
+    # Time labels and break bars (same for every day)
+    parts.append(grid_scaffold_html)
 
-        # Session blocks
-        for session in day_schedule.sessions:
-            colors = color_map.get(session.group_header, _DEFAULT_COLOR)
-            row_start = time_to_grid_row(session.start_time)
-            row_end = time_to_grid_row(session.end_time)
-
-            if row_end <= row_start:
-                if session.duration_minutes > 0:
-                    row_end = row_start + 1
-                else:
-                    continue  # Skip zero/negative duration
-
-            # Map session room columns to this day's room layout.
-            # session.room_col_start/end are global (with col 1=time),
-            # but we need to ensure they fit within this day's room count.
-            col_start = session.room_col_start
-            col_end = session.room_col_end
-            # Clamp to valid range
-            col_end = min(col_end, num_rooms + 2)
-            col_start = max(col_start, 2)
-            if col_start >= col_end:
-                col_start = 2
-                col_end = 3
-
-            style = (
-                f"grid-row:{row_start}/{row_end};"
-                f"grid-column:{col_start}/{col_end};"
-                f"--session-bg:{colors['bg']};"
-                f"--session-border:{colors['border']};"
-                f"--session-text:{colors['text']}"
-            )
+    # Escaped room names for the popups, indexed by column - 2
+    esc_room_names = [_esc(room.name) for room in day_schedule.rooms]
+
+    # Session blocks
+    for session in day_schedule.sessions:
+        row_start = time_to_grid_row(session.start_time)
+        row_end = time_to_grid_row(session.end_time)
+
+        if row_end <= row_start:
+            if session.duration_minutes > 0:
+                row_end = row_start + 1
+            else:
+                continue  # Skip zero/negative duration
+
+        # Map session room columns to this day's room layout.
+        # session.room_col_start/end are global (with col 1=time),
+        # but we need to ensure they fit within this day's room count.
+        col_start = session.room_col_start
+        col_end = session.room_col_end
+        # Clamp to valid range
+        col_end = min(col_end, num_rooms + 2)
+        col_start = max(col_start, 2)
+        if col_start >= col_end:
+            col_start = 2
+            col_end = 3
+
+        group_style, group_popup_line = group_parts.get(
+            session.group_header, _UNGROUPED_PARTS
+        )
+        style = (
+            f"grid-row:{row_start}/{row_end};"
+            f"grid-column:{col_start}/{col_end};"
+            f"{group_style}"
+        )
 
-            # Content based on block height — order: Name, Chair, Time, AI
-            slots = row_end - row_start
-            is_short = slots <= 2
-            is_tiny = slots <= 1
-            display_name = (
+        # Escaped values reused by the label and popup
+        esc_name = _esc(session.name)
+        esc_chair = _esc(session.chair) if session.chair else ""
+        esc_ai = _esc(session.agenda_item) if session.agenda_item else ""
+
+        # Content based on block height — order: Name, Chair, Time, AI
+        slots = row_end - row_start
+        is_short = slots <= 2
+        is_tiny = slots <= 1
+        if is_tiny:
+            esc_display_name = _esc(
                 _compact_session_label(session.name, session.agenda_item)
-                if is_tiny
-                else session.name
-            )
-            name_html = f'<div class="session-name">{_esc(display_name)}</div>'
-            chair_html = ""
-            dur_html = ""
-            ai_html = ""
-
-            if slots >= 3 and session.chair:
-                chair_html = (
-                    f'<div class="session-chair">{_esc(session.chair)}</div>'
-                )
-            if slots >= 4:
-                dur_html = (
-                    f'<div class="session-duration">'
-                    f"{session.start_time}-{session.end_time} "
-                    f"({session.duration_minutes}m)</div>"
-                )
-            if session.agenda_item and slots >= 6:
-                ai_html = (
-                    f'<div class="session-ai">AI {_esc(session.agenda_item)}</div>'
-                )
-
-            # Popup (click-to-show)
-            popup_lines = [f"<strong>{_esc(session.name)}</strong>"]
-            if session.group_header:
-                popup_lines.append(f"Group: {_esc(session.group_header)}")
-            if session.chair:
-                popup_lines.append(f"Chair: {_esc(session.chair)}")
-            if session.agenda_item:
-                popup_lines.append(f"AI: {_esc(session.agenda_item)}")
-            popup_lines.append(
-                f"Time: {session.start_time} - {session.end_time} ({session.duration_minutes} min)"
             )
-            room_names_in_span = []
-            for ri in range(col_start - 2, min(col_end - 2, num_rooms)):
-                if ri < len(day_schedule.rooms):
-                    room_names_in_span.append(day_schedule.rooms[ri].name)
-            if room_names_in_span:
-                popup_lines.append(f"Room: {', '.join(room_names_in_span)}")
-            popup_html = "<br>".join(popup_lines)
-
-            # Escape popup_html for use in data attribute
-            popup_attr = popup_html.replace('&', '&amp;').replace('"', '&quot;').replace("'", '&#39;')
-
-            # Build secondary details wrapped in a clipping container
-            details_inner = f"{chair_html}{dur_html}{ai_html}"
-            details_html = f'<div class="session-details">{details_inner}</div>' if details_inner else ""
-            is_long = _crosses_time_block(session.start_time, session.end_time)
-            block_classes = "session-block"
-            if is_long:
-                block_classes += " long-session"
-            if is_short:
-                block_classes += " short-session"
-            if is_tiny:
-                block_classes += " tiny-session"
-
-            # Filter data attributes – only actual AI values
-            if session.agenda_item:
-                ai_vals = [a.strip() for a in session.agenda_item.split(",") if a.strip()]
-                data_ai = "|".join(ai_vals)
-            else:
-                data_ai = ""
-            data_ai_attr = _esc(data_ai).replace('"', '&quot;')
-            data_name_attr = _esc(session.name).replace('"', '&quot;')
-            data_group_attr = _esc(session.group_header).replace('"', '&quot;')
-
-            html_parts.append(
-                f'                <div class="{block_classes}" style="{style}"'
-                f' data-popup="{popup_attr}"'
-                f' data-ai="{data_ai_attr}"'
-                f' data-name="{data_name_attr}"'
-                f' data-group="{data_group_attr}"'
-                f'>\n'
-                f"                    {name_html}{details_html}\n"
-                f"                </div>\n"
+        else:
+            esc_display_name = esc_name
+        name_html = f'<div class="session-name">{esc_display_name}</div>'
+        chair_html = ""
+        dur_html = ""
+        ai_html = ""
+
+        if slots >= 3 and esc_chair:
+            chair_html = f'<div class="session-chair">{esc_chair}</div>'
+        if slots >= 4:
+            dur_html = (
+                f'<div class="session-duration">'
+                f"{session.start_time}-{session.end_time} "
+                f"({session.duration_minutes}m)</div>"
             )
-
-        html_parts.append(
-            "            </div>\n"
-            "        </div>\n"
-            "    </div>\n"
+        if esc_ai and slots >= 6:
+            ai_html = f'<div class="session-ai">AI {esc_ai}</div>'
+
+        # Popup (click-to-show)
+        popup_lines = [f"<strong>{esc_name}</strong>"]
+        if group_popup_line:
+            popup_lines.append(group_popup_line)
+        if esc_chair:
+            popup_lines.append(f"Chair: {esc_chair}")
+        if esc_ai:
+            popup_lines.append(f"AI: {esc_ai}")
+        popup_lines.append(
+            f"Time: {session.start_time} - {session.end_time} ({session.duration_minutes} min)"
         )
+        room_names_in_span = esc_room_names[col_start - 2:col_end - 2]
+        if room_names_in_span:
+            popup_lines.append(f"Room: {', '.join(room_names_in_span)}")
+        popup_html = "<br>".join(popup_lines)
+
+        # Escape popup_html for use in data attribute
+        popup_attr = popup_html.translate(_POPUP_ATTR_TABLE)
+
+        # Build secondary details wrapped in a clipping container
+        details_inner = f"{chair_html}{dur_html}{ai_html}"
+        details_html = f'<div class="session-details">{details_inner}</div>' if details_inner else ""
+        is_long = _crosses_time_block(session.start_time, session.end_time)
+        block_classes = "session-block"
+        if is_long:
+            block_classes += " long-session"
+        if is_short:
+            block_classes += " short-session"
+        if is_tiny:
+            block_classes += " tiny-session"
+
+        # Filter ids – only actual AI values set bits in the mask
+        ai_mask = 0
+        if session.agenda_item:
+            for ai in session.agenda_item.split(","):
+                ai = ai.strip()
+                if ai:
+                    ai_mask |= 1 << ai_index[ai]
+        block_rows.append([
+            session_index[f"{session.name}|{session.group_header or ''}"],
+            format(ai_mask, "x"),
+        ])
+
+        parts.append(f"""\
+                <div class="{block_classes}" style="{style}" data-popup="{popup_attr}">
+                    {name_html}{details_html}
+                </div>
+""")
 
-    # Shared floating popup and backdrop
-    html_parts.append('    <div class="popup-backdrop" id="popup-backdrop"></div>\n')
-    html_parts.append('    <div class="popup-floating" id="popup-floating"><div id="popup-content"></div><button class="popup-close" id="popup-close-btn">&times;</button></div>\n')
+    parts.append(
+        "            </div>\n"
+        "        </div>\n"
+        "    </div>\n"
+    )
+    return "".join(parts), block_rows
 
-    # Filter panel
-    html_parts.append('    <div class="filter-panel collapsed">\n')
-    html_parts.append('        <button class="filter-toggle">&#9664; Filter</button>\n')
-    html_parts.append('        <div class="filter-header"><span>Session Filter <span class="filter-active-count"></span></span><button class="filter-clear">Clear</button></div>\n')
-    html_parts.append('        <div class="filter-controls"><label for="filter-dim-opacity-range">Unchecked opacity</label><div class="filter-dim-opacity"><input type="range" id="filter-dim-opacity-range" class="filter-dim-opacity-range" min="0.02" max="0.95" step="0.01" value="0.12"><span class="filter-dim-opacity-value">12%</span></div></div>\n')
-    html_parts.append('        <div class="filter-list"></div>\n')
-    html_parts.append('    </div>\n')
 
-    # Filter data (JSON, read by JS)
-    html_parts.append(f'    <script type="application/json" id="filter-data">{filter_data_json}</script>\n')
+def _grid_scaffold_html() -> str:
+    """Return the time labels and break bars shared by all day grids."""
+    parts = []
 
-    # Close container and add JS
-    html_parts.append(f"""</div>
-<script>{_generate_js(schedule.timezone)}</script>
-</body>
-</html>""")
+    # Time labels every 30 minutes; grid lines are drawn by .schedule-grid::before
+    for time_min in range(_GRID_START_MIN, _GRID_END_MIN + 1, 30):
+        row = (time_min - _GRID_START_MIN) // 5 + 2
+        parts.append(
+            f'                <div class="time-label" '
+            f'style="grid-row:{row}/{row + 6}">'
+            f'{time_min // 60:02d}:{time_min % 60:02d}</div>\n'
+        )
 
-    return "".join(html_parts)
+    # Break bars
+    for row_start, row_end, name in _BREAK_ROWS:
+        parts.append(
+            f'                <div class="break-bar" '
+            f'style="grid-row:{row_start}/{row_end}">{_esc(name)}</div>\n'
+        )
+    return "".join(parts)
 
 
 def _crosses_time_block(start_time: str, end_time: str) -> bool:
@@ -1556,8 +1737,8 @@ def _crosses_time_block(start_time: str, end_time: str) -> bool:
     s = time_to_minutes(start_time)
     e = time_to_minutes(end_time)
     for tb in TIME_BLOCKS:
-        tb_start = time_to_minutes(tb["start"])
-        tb_end = time_to_minutes(tb["end"])
+        tb_start = time_to_minutes(tb.start)
+        tb_end = time_to_minutes(tb.end)
         if s >= tb_start and e <= tb_end:
             return False
     return True
@@ -1568,20 +1749,29 @@ def save_html(schedule: Schedule, output_path: str | Path = "docs/index.html"):
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    html = generate_html(schedule)
-    output_path.write_text(html, encoding="utf-8")
+    # Stream fragments to a sibling temp file rather than joining the whole
+    # page in memory, then swap it in so a failed run never leaves the
+    # published page truncated
+    tmp_path = output_path.with_name(f".{output_path.name}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8", newline="\n", buffering=1 << 20) as f:
+            f.writelines(_iter_html(schedule))
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
     print(f"HTML saved to: {output_path}")
     return output_path
 
 
+_ESC_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+# Popup markup is already escaped; this escapes it once more for data-popup
+_POPUP_ATTR_TABLE = str.maketrans({"&": "&amp;", '"': "&quot;", "'": "&#39;"})
+
+
 def _esc(text: str) -> str:
     """HTML-escape a string."""
-    return (
-        text.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-    )
+    return text.translate(_ESC_TABLE)
 
 
 def _compact_session_label(name: str, agenda_item: str | None) -> str:
@@ -1589,6 +1779,16 @@ def _compact_session_label(name: str, agenda_item: str | None) -> str:
     if agenda_item:
         return f"AI {agenda_item}"
 
+    # Common case: short name whose only whitespace is single inner spaces
+    if (
+        len(name) <= 22
+        and name.isprintable()
+        and "  " not in name
+        and name[:1] != " "
+        and name[-1:] != " "
+    ):
+        return name
+
     normalized = " ".join(name.split())
     if len(normalized) <= 22:
         return normalized
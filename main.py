@@ -27,16 +27,18 @@ import argparse
 import os
 import re
 import sys
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
+from zoneinfo import ZoneInfo
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from models import DAY_ORDER, DaySchedule, Schedule
+from models import DAY_INDEX, DAY_ORDER, DaySchedule, Schedule, Session
 from parser import build_room_list, parse_docx, extract_meeting_location, find_chair_notes_docx
-from session_parser import parse_time_slots, get_timezone_from_location, normalize_group_headers, fill_missing_groups
+from session_parser import parse_time_slots, get_timezone_from_location, normalize_and_fill_groups
 from generator import save_html
 from downloader import (
     download_latest_schedule,
@@ -54,11 +56,15 @@ from downloader import (
 from merger import collect_time_slot_data
 from config import load_config
 
+_MEETING_NAME_RE = re.compile(r"(RAN\d+#\d+\w*)")
+_EMAIL_LOCAL_PART_RE = re.compile(r"^[A-Za-z0-9.!#$%&'*+/=?^_`{|}\-]+$")
+_EMAIL_DOMAIN_RE = re.compile(r"^[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*$")
+
 
 def _extract_meeting_name(filepath: Path) -> str:
     """Try to extract meeting name from the filename."""
     name = filepath.stem
-    match = re.search(r"(RAN\d+#\d+\w*)", name)
+    match = _MEETING_NAME_RE.search(name)
     if match:
         return match.group(1)
     return name
@@ -73,9 +79,9 @@ def _validate_contact_email(contact_email: str) -> str | None:
         return "SCHEDULE_CONTACT_EMAIL must include a local part and domain"
     if ".." in local_part or ".." in domain_part:
         return "SCHEDULE_CONTACT_EMAIL must not contain consecutive dots"
-    if not re.match(r"^[A-Za-z0-9.!#$%&'*+/=?^_`{|}\-]+$", local_part):
+    if not _EMAIL_LOCAL_PART_RE.match(local_part):
         return "SCHEDULE_CONTACT_EMAIL has an invalid local part"
-    if not re.match(r"^[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*$", domain_part):
+    if not _EMAIL_DOMAIN_RE.match(domain_part):
         return "SCHEDULE_CONTACT_EMAIL has an invalid domain"
     return None
 
@@ -179,7 +185,7 @@ def main():
     day_rooms_map = build_room_list(tables_meta)
     for day, rooms in sorted(
         day_rooms_map.items(),
-        key=lambda x: DAY_ORDER.index(x[0]) if x[0] in DAY_ORDER else 99,
+        key=lambda x: DAY_INDEX.get(x[0], 99),
     ):
         room_names = [r.name for r in rooms]
         print(f"  {day}: {len(rooms)} rooms — {', '.join(room_names)}")
@@ -197,11 +203,9 @@ def main():
     sessions = parse_time_slots(time_slots, day_rooms_map)
     print(f"Parsed {len(sessions)} sessions")
 
-    # Step 4b: Normalize group headers for cleaner legend
-    sessions = normalize_group_headers(sessions)
-
-    # Step 4c: Fill missing groups by name/substring matching
-    sessions = fill_missing_groups(sessions)
+    # Step 4b: Normalize group headers for cleaner legend, then fill
+    # missing groups by name/substring matching
+    sessions = normalize_and_fill_groups(sessions)
 
     # Step 5: Build Schedule model
     meeting_name = _extract_meeting_name(docx_path)
@@ -272,24 +276,21 @@ def main():
             timezone=meeting_tz,
         )
 
-    days = []
-    for day_name in DAY_ORDER:
-        if day_name not in day_rooms_map:
-            continue
-        rooms = day_rooms_map[day_name]
-        day_sessions = [s for s in sessions if s.day == day_name]
-        if rooms:
-            days.append(
-                DaySchedule(
-                    day_name=day_name,
-                    rooms=rooms,
-                    sessions=day_sessions,
-                )
-            )
+    sessions_by_day: defaultdict[str, list[Session]] = defaultdict(list)
+    for s in sessions:
+        sessions_by_day[s.day].append(s)
 
-    # Generate timestamp in meeting timezone
-    from zoneinfo import ZoneInfo
+    days = [
+        DaySchedule(
+            day_name=day_name,
+            rooms=rooms,
+            sessions=sessions_by_day.get(day_name, []),
+        )
+        for day_name in DAY_ORDER
+        if (rooms := day_rooms_map.get(day_name))
+    ]
 
+    # Generate timestamp in meeting timezone
     try:
         tz_info = ZoneInfo(meeting_tz)
         generated_at = datetime.now(tz_info).strftime("%Y-%m-%d %H:%M")
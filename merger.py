@@ -9,10 +9,13 @@ produce the most detailed session list possible.
 
 from __future__ import annotations
 
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from models import CellData, RoomInfo, TIME_BLOCKS
+from models import DAY_INDEX, TIME_BLOCKS, CellData, RoomInfo
 from parser import parse_docx, build_room_list
 
 
@@ -28,7 +31,8 @@ def _resolve_vc_room_names(
     When a vice-chair schedule table has fallback room names like "Room A",
     this function uses the paragraph context (title/heading above the table)
     and LLM to determine which of the main schedule's rooms the table
-    actually represents.
+    actually represents.  Tables needing resolution are sent to the LLM
+    concurrently, one call per distinct context.
 
     Mutates vc_meta in place, updating day_rooms entries.
     """
@@ -40,6 +44,8 @@ def _resolve_vc_room_names(
     if not available_rooms:
         return
 
+    # 1. Pick out tables whose rooms still have generic names
+    pending: list[tuple[dict, list[str]]] = []  # (meta, sample_rooms)
     for meta in vc_meta:
         context_text = meta.get("context_text", "")
         day_rooms = meta["day_rooms"]
@@ -63,14 +69,41 @@ def _resolve_vc_room_names(
                   f"({sample_rooms}) but no context text for LLM resolution")
             continue
 
-        num_rooms = len(sample_rooms)
+        pending.append((meta, sample_rooms))
+
+    if not pending:
+        return
+
+    # 2. Detect rooms concurrently (I/O-bound LLM calls).  Tables with the
+    #    same context and width share one call; workers collect their log
+    #    lines so they can be printed in table order below.
+    requests = list(dict.fromkeys(
+        (meta["context_text"], len(sample_rooms)) for meta, sample_rooms in pending
+    ))
+
+    def detect(request: tuple[str, int]) -> tuple[list[str] | None, list[str]]:
+        context_text, num_rooms = request
+        messages: list[str] = []
         detected = detect_room_from_context(
             context_text,
             available_rooms,
             num_rooms,
             room_hints=room_hints,
+            messages=messages,
         )
+        return detected, messages
+
+    with ThreadPoolExecutor(max_workers=min(len(requests), 8)) as pool:
+        results = dict(zip(requests, pool.map(detect, requests)))
 
+    # 3. Apply results in table order
+    for meta, sample_rooms in pending:
+        num_rooms = len(sample_rooms)
+        detected, messages = results[(meta["context_text"], num_rooms)]
+        for line in messages:
+            print(line)
+        messages.clear()  # shared contexts log once
+        day_rooms = meta["day_rooms"]
         if detected and len(detected) == num_rooms:
             # Update room names for all days
             for day in day_rooms:
@@ -139,7 +172,7 @@ def _build_room_hints(main_rooms_map: dict[str, list[RoomInfo]]) -> dict:
 # ── Data structures ──────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceEntry:
     """One cell's data from a specific source."""
 
@@ -147,7 +180,7 @@ class SourceEntry:
     cell_text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SlotSource:
     """All cells from one source for a given time slot."""
 
@@ -155,7 +188,7 @@ class SlotSource:
     entries: list[SourceEntry] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeSlotData:
     """Aggregated data for one (day, time_block) across all sources."""
 
@@ -171,18 +204,29 @@ class TimeSlotData:
 # ── Collection logic ─────────────────────────────────────────
 
 
+def _room_lookup(
+    rooms_for_day: list[RoomInfo],
+) -> dict[tuple[int, int], RoomInfo]:
+    """Index a day's rooms by (table_index, room_index_in_table)."""
+    return {(r.table_index, r.room_index_in_table): r for r in rooms_for_day}
+
+
 def _room_label_for_cell(
-    cell: CellData, rooms_for_day: list[RoomInfo],
+    cell: CellData, room_lookup: dict[tuple[int, int], RoomInfo],
 ) -> str:
-    """Build a human-readable room label for a cell."""
-    if not rooms_for_day:
+    """Build a human-readable room label for a cell.
+
+    ``room_lookup`` is the day's rooms as built by ``_room_lookup``.
+    """
+    if not room_lookup:
         indices = ", ".join(str(i) for i in cell.room_indices)
         return f"Room [{indices}]"
 
+    table_index = cell.table_index
     matching = [
-        r for r in rooms_for_day
-        if r.table_index == cell.table_index
-        and r.room_index_in_table in cell.room_indices
+        room_lookup[table_index, i]
+        for i in sorted(set(cell.room_indices))
+        if (table_index, i) in room_lookup
     ]
     if matching:
         return " + ".join(r.name for r in matching)
@@ -196,13 +240,52 @@ def _group_cells_by_slot(
     cells: list[CellData],
 ) -> dict[tuple[str, int], list[CellData]]:
     """Group cells by (day, time_block_index)."""
-    groups: dict[tuple[str, int], list[CellData]] = {}
+    groups: defaultdict[tuple[str, int], list[CellData]] = defaultdict(list)
     for cell in cells:
-        key = (cell.day, cell.time_block_index)
-        groups.setdefault(key, []).append(cell)
+        groups[cell.day, cell.time_block_index].append(cell)
+    # Behave like a plain dict for callers (no auto-insert on lookup)
+    groups.default_factory = None
     return groups
 
 
+def _parse_vc_docx(path: Path) -> tuple[list[CellData], list[dict]]:
+    """Parse ALL schedule tables of a vice-chair DOCX (runs in a worker)."""
+    return parse_docx(path, max_tables=None)
+
+
+def _parse_vc_docs(
+    vice_chair_paths: dict[str, Path],
+) -> dict[str, tuple[list[CellData], list[dict]] | Exception]:
+    """Parse vice-chair DOCX files in parallel worker processes.
+
+    Returns person → (cells, tables_meta), or the exception raised while
+    parsing that person's file.
+    """
+    results: dict[str, tuple[list[CellData], list[dict]] | Exception] = {}
+    if len(vice_chair_paths) < 2:
+        for person, path in vice_chair_paths.items():
+            try:
+                results[person] = _parse_vc_docx(path)
+            except Exception as e:
+                results[person] = e
+        return results
+
+    max_workers = min(len(vice_chair_paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(_parse_vc_docx, path): person
+            for person, path in vice_chair_paths.items()
+        }
+        for future in as_completed(futures):
+            person = futures[future]
+            try:
+                results[person] = future.result()
+            except Exception as e:
+                results[person] = e
+            print(f"    Parsed {person}'s schedule")
+    return results
+
+
 def collect_time_slot_data(
     main_cells: list[CellData],
     main_rooms_map: dict[str, list[RoomInfo]],
@@ -222,17 +305,22 @@ def collect_time_slot_data(
     Returns:
         List of TimeSlotData, sorted by day order then time block index.
     """
-    from models import DAY_ORDER
-
     # 1. Group main cells by time slot
     main_groups = _group_cells_by_slot(main_cells)
 
-    # 2. Parse vice-chair schedules (ALL tables) and group
-    vc_data: dict[str, tuple[dict, dict]] = {}  # person → (cell_groups, rooms_map)
+    # 2. Parse vice-chair schedules (ALL tables) in parallel, then resolve
+    #    rooms and group them in input order
     for person, path in vice_chair_paths.items():
         print(f"  Parsing {person}'s schedule (all tables): {path.name}")
+    vc_parsed = _parse_vc_docs(vice_chair_paths)
+
+    vc_data: dict[str, tuple[dict, dict]] = {}  # person → (cell_groups, rooms_map)
+    for person in vice_chair_paths:
         try:
-            vc_cells, vc_meta = parse_docx(path, max_tables=None)
+            parsed = vc_parsed[person]
+            if isinstance(parsed, Exception):
+                raise parsed
+            vc_cells, vc_meta = parsed
 
             # Resolve generic room names using LLM + document context
             _resolve_vc_room_names(vc_meta, main_rooms_map)
@@ -241,12 +329,16 @@ def collect_time_slot_data(
             vc_groups = _group_cells_by_slot(vc_cells)
             vc_data[person] = (vc_groups, vc_rooms)
             total = sum(len(v) for v in vc_groups.values())
-            print(f"    → {total} cells across {len(vc_groups)} time slots")
+            print(f"    → {person}: {total} cells across {len(vc_groups)} time slots")
         except Exception as e:
-            print(f"    → Failed: {e}")
+            print(f"    → {person}: Failed: {e}")
 
     # 3. Build TimeSlotData for each (day, time_block)
     time_slots: list[TimeSlotData] = []
+    main_lookups = {
+        day: _room_lookup(rooms) for day, rooms in main_rooms_map.items()
+    }
+    vc_lookups: dict[tuple[str, str], dict[tuple[int, int], RoomInfo]] = {}
 
     for (day, tb_idx), m_cells in main_groups.items():
         tb = TIME_BLOCKS[tb_idx]
@@ -255,46 +347,64 @@ def collect_time_slot_data(
         slot = TimeSlotData(
             day=day,
             time_block_index=tb_idx,
-            time_block_start=tb["start"],
-            time_block_end=tb["end"],
-            time_block_duration=tb["duration"],
+            time_block_start=tb.start,
+            time_block_end=tb.end,
+            time_block_duration=tb.duration,
             main_rooms=main_rooms,
         )
 
         # Add main schedule source
         main_source = SlotSource(label="Main Schedule")
+        main_lookup = main_lookups.get(day, {})
+        main_text_list: list[str] = []
+        seen: set[tuple[str, str]] = set()  # (room_label, text) already added
         for cell in m_cells:
-            room_label = _room_label_for_cell(cell, main_rooms)
+            text = cell.text.strip()
+            if not text:
+                continue
+            main_text_list.append(text)
+            room_label = _room_label_for_cell(cell, main_lookup)
+            if (room_label, text) in seen:
+                continue
+            seen.add((room_label, text))
             main_source.entries.append(
-                SourceEntry(room_label=room_label, cell_text=cell.text)
+                SourceEntry(room_label=room_label, cell_text=text)
             )
         slot.sources.append(main_source)
 
         # Add vice-chair sources
         main_room_names = {r.name for r in main_rooms}
+        # De-duplicate: skip VC entries whose text is identical to a main entry
+        main_texts = frozenset(main_text_list)
+        key = (day, tb_idx)
         for person, (vc_groups, vc_rooms) in vc_data.items():
-            key = (day, tb_idx)
             if key not in vc_groups:
                 continue
 
             vc_cells = vc_groups[key]
-            vc_day_rooms = vc_rooms.get(day, [])
-
-            # De-duplicate: skip VC entries whose text is identical to a main entry
-            main_texts = {cell.text.strip() for cell in m_cells}
+            vc_lookup = vc_lookups.get((person, day))
+            if vc_lookup is None:
+                vc_lookup = vc_lookups[person, day] = _room_lookup(
+                    vc_rooms.get(day, [])
+                )
 
             vc_source = SlotSource(label=f"{person}'s schedule")
+            seen = set()
             for cell in vc_cells:
-                if cell.text.strip() in main_texts:
-                    continue  # Skip duplicate content
-                room_label = _room_label_for_cell(cell, vc_day_rooms)
+                text = cell.text.strip()
+                if not text or text in main_texts:
+                    continue  # Skip empty or duplicate content
+                room_label = _room_label_for_cell(cell, vc_lookup)
                 # Prefix VC room labels that match a main target room name
                 # to prevent Gemini from blindly assigning sessions by label.
                 # Content-based matching in the LLM handles correct placement.
                 if room_label in main_room_names:
                     room_label = f"{person}: {room_label}"
+                if (room_label, text) in seen:
+                    continue
+                seen.add((room_label, text))
                 vc_source.entries.append(
-                    SourceEntry(room_label=room_label, cell_text=cell.text)
+                    SourceEntry(room_label=room_label, cell_text=text)
                 )
 
             if vc_source.entries:
@@ -305,7 +415,7 @@ def collect_time_slot_data(
     # Sort by day order, then time block
     time_slots.sort(
         key=lambda s: (
-            DAY_ORDER.index(s.day) if s.day in DAY_ORDER else 99,
+            DAY_INDEX.get(s.day, 99),
             s.time_block_index,
         )
     )
@@ -4,15 +4,25 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import NamedTuple
+
+
+class TimeBlock(NamedTuple):
+    """One session block of the standard meeting day."""
+
+    index: int
+    start: str  # "HH:MM"
+    end: str  # "HH:MM"
+    duration: int  # minutes
 
 
 # Time blocks in the standard 3GPP meeting day
-TIME_BLOCKS = [
-    {"index": 0, "start": "08:30", "end": "10:30", "duration": 120},
-    {"index": 1, "start": "11:00", "end": "13:00", "duration": 120},
-    {"index": 2, "start": "14:30", "end": "16:30", "duration": 120},
-    {"index": 3, "start": "17:00", "end": "19:30", "duration": 150},
-]
+TIME_BLOCKS = (
+    TimeBlock(0, "08:30", "10:30", 120),
+    TimeBlock(1, "11:00", "13:00", 120),
+    TimeBlock(2, "14:30", "16:30", 120),
+    TimeBlock(3, "17:00", "19:30", 150),
+)
 
 BREAKS = [
     {"name": "Morning Coffee Break", "start": "10:30", "end": "11:00"},
@@ -20,10 +30,13 @@ BREAKS = [
     {"name": "Afternoon Coffee Break", "start": "16:30", "end": "17:00"},
 ]
 
-DAY_ORDER = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
+DAY_ORDER = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday")
+
+# Day name -> position in DAY_ORDER (for sort keys)
+DAY_INDEX = {day: i for i, day in enumerate(DAY_ORDER)}
 
 
-@dataclass
+@dataclass(slots=True)
 class CellData:
     """Raw cell data extracted from DOCX table."""
 
@@ -37,7 +50,7 @@ class CellData:
     table_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class RoomInfo:
     """A room across all tables for a given day."""
 
@@ -46,7 +59,7 @@ class RoomInfo:
     room_index_in_table: int  # position within the table's rooms for this day
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """A parsed session with calculated times."""
 
@@ -62,7 +75,7 @@ class Session:
     group_header: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleSource:
     """A discovered schedule source from the FTP server."""
 
@@ -73,7 +86,7 @@ class ScheduleSource:
     local_path: Path | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DaySchedule:
     """All sessions for one day across all rooms."""
 
@@ -82,7 +95,7 @@ class DaySchedule:
     sessions: list[Session] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Schedule:
     """Complete parsed schedule."""
 
@@ -107,6 +120,37 @@ def minutes_to_time(m: int) -> str:
     return f"{m // 60:02d}:{m % 60:02d}"
 
 
+def find_newest_file(
+    directory: Path, suffixes: tuple[str, ...], keywords: tuple[str, ...],
+) -> Path | None:
+    """Return the newest file in *directory* by modification time.
+
+    Only files whose lowercased name contains one of *keywords* and ends
+    with one of *suffixes* are considered.  When several files share the
+    newest mtime, the one whose suffix comes first in *suffixes* wins.
+    Returns None if the directory is missing or nothing matches.
+    """
+    if not directory.is_dir():
+        return None
+
+    # One directory listing instead of one glob per extension.  Candidates
+    # stay grouped by extension so that the earlier suffix wins an mtime tie.
+    candidates = [
+        f
+        for f in directory.iterdir()
+        if any(k in f.name.lower() for k in keywords)
+    ]
+    matches = [
+        f
+        for ext in suffixes
+        for f in candidates
+        if f.name.endswith(ext)
+    ]
+    if not matches:
+        return None
+    return max(matches, key=lambda f: f.stat().st_mtime)
+
+
 def time_to_grid_row(t: str) -> int:
     """Convert 'HH:MM' to CSS grid row number (1-indexed, row 1 = header)."""
     mins = time_to_minutes(t)
@@ -115,22 +159,31 @@ def time_to_grid_row(t: str) -> int:
     return slot + 2  # row 1 is header
 
 
-GROUP_COLORS = [
-    {"bg": "#DBEAFE", "border": "#2563EB", "text": "#1E40AF"},  # Blue
-    {"bg": "#FCE7F3", "border": "#DB2777", "text": "#9D174D"},  # Pink
-    {"bg": "#D1FAE5", "border": "#059669", "text": "#065F46"},  # Green
-    {"bg": "#FED7AA", "border": "#EA580C", "text": "#9A3412"},  # Orange
-    {"bg": "#E9D5FF", "border": "#7C3AED", "text": "#5B21B6"},  # Purple
-    {"bg": "#CCFBF1", "border": "#0D9488", "text": "#115E59"},  # Teal
-    {"bg": "#FEF08A", "border": "#CA8A04", "text": "#854D0E"},  # Yellow
-    {"bg": "#C7D2FE", "border": "#4F46E5", "text": "#3730A3"},  # Indigo
-    {"bg": "#FECACA", "border": "#DC2626", "text": "#991B1B"},  # Red
-    {"bg": "#BBF7D0", "border": "#16A34A", "text": "#166534"},  # Emerald
-    {"bg": "#BFDBFE", "border": "#3B82F6", "text": "#1D4ED8"},  # Sky
-    {"bg": "#FDE68A", "border": "#D97706", "text": "#92400E"},  # Amber
-    {"bg": "#DDD6FE", "border": "#7C3AED", "text": "#5B21B6"},  # Violet
-    {"bg": "#A7F3D0", "border": "#10B981", "text": "#047857"},  # Emerald light
-    {"bg": "#FECDD3", "border": "#E11D48", "text": "#9F1239"},  # Rose
-    {"bg": "#E0E7FF", "border": "#6366F1", "text": "#4338CA"},  # Indigo light
-]
+@dataclass(frozen=True, slots=True)
+class GroupColor:
+    """Session block colours for one group header."""
+
+    bg: str
+    border: str
+    text: str
+
+
+GROUP_COLORS = (
+    GroupColor(bg="#DBEAFE", border="#2563EB", text="#1E40AF"),  # Blue
+    GroupColor(bg="#FCE7F3", border="#DB2777", text="#9D174D"),  # Pink
+    GroupColor(bg="#D1FAE5", border="#059669", text="#065F46"),  # Green
+    GroupColor(bg="#FED7AA", border="#EA580C", text="#9A3412"),  # Orange
+    GroupColor(bg="#E9D5FF", border="#7C3AED", text="#5B21B6"),  # Purple
+    GroupColor(bg="#CCFBF1", border="#0D9488", text="#115E59"),  # Teal
+    GroupColor(bg="#FEF08A", border="#CA8A04", text="#854D0E"),  # Yellow
+    GroupColor(bg="#C7D2FE", border="#4F46E5", text="#3730A3"),  # Indigo
+    GroupColor(bg="#FECACA", border="#DC2626", text="#991B1B"),  # Red
+    GroupColor(bg="#BBF7D0", border="#16A34A", text="#166534"),  # Emerald
+    GroupColor(bg="#BFDBFE", border="#3B82F6", text="#1D4ED8"),  # Sky
+    GroupColor(bg="#FDE68A", border="#D97706", text="#92400E"),  # Amber
+    GroupColor(bg="#DDD6FE", border="#7C3AED", text="#5B21B6"),  # Violet
+    GroupColor(bg="#A7F3D0", border="#10B981", text="#047857"),  # Emerald light
+    GroupColor(bg="#FECDD3", border="#E11D48", text="#9F1239"),  # Rose
+    GroupColor(bg="#E0E7FF", border="#6366F1", text="#4338CA"),  # Indigo light
+)
 
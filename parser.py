@@ -3,14 +3,32 @@
 from __future__ import annotations
 
 import re
+import sys
+import xml.etree.ElementTree as ET
+import zipfile
+from functools import lru_cache
 from pathlib import Path
 
 from docx import Document
 
-from models import TIME_BLOCKS, CellData, DAY_ORDER, RoomInfo, time_to_minutes
+from models import (
+    TIME_BLOCKS, CellData, DAY_ORDER, RoomInfo, find_newest_file, time_to_minutes,
+)
+
+_DAY_NAME_RE = re.compile("|".join(DAY_ORDER), re.IGNORECASE)
+# (day, lowercase day) pairs for substring checks against lowered text
+_DAY_NAMES_LOWER = tuple((day, day.lower()) for day in DAY_ORDER)
+# Start time in a time label cell, e.g. "08:30\n~\n10:30"
+_TIME_RE = re.compile(r"(\d{1,2}:\d{2})")
+# Parenthesised room code, e.g. "RAN1_Off#1 (J1)"
+_PAREN_RE = re.compile(r"\(([^)]+)\)")
+# Meeting location line, e.g. "Dallas, USA, Nov 17th – 21st, 2025"
+_LOCATION_RE = re.compile(
+    r"^[A-Z][A-Za-z .'-]+,\s*[A-Z][A-Za-z .'-]+,\s*[A-Za-z]+\.?\s+\d"
+)
 
 _TIME_BLOCK_MINUTES = [
-    (block["index"], time_to_minutes(block["start"]), time_to_minutes(block["end"]))
+    (block.index, time_to_minutes(block.start), time_to_minutes(block.end))
     for block in TIME_BLOCKS
 ]
 
@@ -37,10 +55,7 @@ def extract_meeting_location(docx_path: Path) -> str | None:
         #   "Dallas, USA, Nov 17th – 21st, 2025"
         #   "Athens, Greece, February 17th – 21st, 2025"
         # Allow both 2-letter and full country names.
-        if re.search(
-            r"^[A-Z][A-Za-z .'-]+,\s*[A-Z][A-Za-z .'-]+,\s*[A-Za-z]+\.?\s+\d",
-            text,
-        ):
+        if _LOCATION_RE.search(text):
             return text
     return None
 
@@ -52,16 +67,9 @@ def find_chair_notes_docx(dest_dir: Path = Path("downloads/Chair_notes")) -> Pat
     supporting .docx, .pptx, and .pdf extensions.
     Returns the one with the highest modification time.
     """
-    supported_extensions = (".docx", ".pptx", ".pdf")
-    chair_files = [
-        f
-        for ext in supported_extensions
-        for f in dest_dir.glob(f"*{ext}")
-        if "chair note" in f.name.lower() or "chair_note" in f.name.lower()
-    ]
-    if not chair_files:
-        return None
-    return max(chair_files, key=lambda f: f.stat().st_mtime)
+    return find_newest_file(
+        dest_dir, (".docx", ".pptx", ".pdf"), ("chair note", "chair_note"),
+    )
 
 
 # Namespace for OpenXML
@@ -70,6 +78,72 @@ _MC_NS = "http://schemas.openxmlformats.org/markup-compatibility/2006"
 _A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
 _V_NS = "urn:schemas-microsoft-com:vml"
 _WPS_NS = "http://schemas.microsoft.com/office/word/2010/wordprocessingShape"
+# Package relationships (``_rels/.rels``) locating the main document part
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_OFFICE_DOCUMENT_REL_TYPES = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument",
+    "http://purl.oclc.org/ooxml/officeDocument/relationships/officeDocument",
+)
+_DEFAULT_DOCUMENT_PART = "word/document.xml"
+
+# Qualified tag/attribute names used in the element-walking loops
+_W_BODY = f"{{{_NS}}}body"
+_W_TBL = f"{{{_NS}}}tbl"
+_W_TBLGRID = f"{{{_NS}}}tblGrid"
+_W_GRIDCOL = f"{{{_NS}}}gridCol"
+_W_TR = f"{{{_NS}}}tr"
+_W_TC = f"{{{_NS}}}tc"
+_W_TC_PR = f"{{{_NS}}}tcPr"
+_W_GRID_SPAN = f"{{{_NS}}}gridSpan"
+_W_V_MERGE = f"{{{_NS}}}vMerge"
+_W_SHD = f"{{{_NS}}}shd"
+_W_P = f"{{{_NS}}}p"
+_W_R = f"{{{_NS}}}r"
+_W_R_PR = f"{{{_NS}}}rPr"
+_W_STRIKE = f"{{{_NS}}}strike"
+_W_DSTRIKE = f"{{{_NS}}}dstrike"
+_W_T = f"{{{_NS}}}t"
+_W_VAL = f"{{{_NS}}}val"
+_W_FILL = f"{{{_NS}}}fill"
+_MC_ALTERNATE_CONTENT = f"{{{_MC_NS}}}AlternateContent"
+_V_SHAPE = f"{{{_V_NS}}}shape"
+_WPS_SP_PR = f"{{{_WPS_NS}}}spPr"
+_A_SOLID_FILL = f"{{{_A_NS}}}solidFill"
+_A_SRGB_CLR = f"{{{_A_NS}}}srgbClr"
+
+
+def _main_document_part(zf: zipfile.ZipFile) -> str:
+    """Return the archive name of the DOCX main document part.
+
+    Follows the officeDocument relationship in ``_rels/.rels`` (as
+    python-docx does), falling back to ``word/document.xml`` when the
+    package relationships are missing or name no such part.
+    """
+    try:
+        rels = ET.fromstring(zf.read("_rels/.rels"))
+    except (KeyError, ET.ParseError):
+        return _DEFAULT_DOCUMENT_PART
+    for rel in rels.iterfind(f"{{{_PKG_REL_NS}}}Relationship"):
+        if rel.get("Type") in _OFFICE_DOCUMENT_REL_TYPES and rel.get("Target"):
+            part = rel.get("Target").lstrip("/")
+            if part in zf.namelist():
+                return part
+    return _DEFAULT_DOCUMENT_PART
+
+
+def _read_document_body(filepath: str | Path):
+    """Load the main document part of a DOCX archive and return ``<w:body>``.
+
+    The schedule tables are only ever read, so the raw element tree is
+    walked directly instead of going through python-docx's ``Table`` /
+    ``_Cell`` proxies (which rebuild the cell grid on every access).
+    The stdlib ElementTree is used rather than lxml, whose trees have been
+    seen to hold on to memory after large documents are released; this
+    keeps memory flat across a batch of schedule files.
+    """
+    with zipfile.ZipFile(filepath) as zf:
+        root = ET.fromstring(zf.read(_main_document_part(zf)))
+    return root.find(_W_BODY)
 
 
 def _get_cell_text(cell) -> str:
@@ -81,16 +155,21 @@ def _get_cell_text(cell) -> str:
     can recognise them as cancelled items.
     Paragraphs are joined with ``\\n`` (matching ``cell.text`` behaviour).
     """
+    return _get_tc_text(cell._tc)
+
+
+def _get_tc_text(tc) -> str:
+    """Extract the text of a raw ``<w:tc>`` element (see ``_get_cell_text``)."""
     paragraphs = []
-    for p_el in cell._tc.findall(f".//{{{_NS}}}p"):
+    for p_el in tc.iter(_W_P):
         parts: list[str] = []
-        for r_el in p_el.findall(f".//{{{_NS}}}r"):
-            rpr = r_el.find(f"{{{_NS}}}rPr")
+        for r_el in p_el.iter(_W_R):
+            rpr = r_el.find(_W_R_PR)
             is_strike = rpr is not None and (
-                rpr.find(f"{{{_NS}}}strike") is not None
-                or rpr.find(f"{{{_NS}}}dstrike") is not None
+                rpr.find(_W_STRIKE) is not None
+                or rpr.find(_W_DSTRIKE) is not None
             )
-            for t_el in r_el.findall(f"{{{_NS}}}t"):
+            for t_el in r_el.iterfind(_W_T):
                 if t_el.text:
                     if is_strike:
                         parts.append(f"~~{t_el.text}~~")
@@ -100,101 +179,68 @@ def _get_cell_text(cell) -> str:
     return "\n".join(paragraphs).strip()
 
 
-def _get_grid_span(cell) -> int:
-    """Get the horizontal grid span of a cell."""
-    tc = cell._tc
-    grid_span = tc.find(f".//{{{_NS}}}gridSpan")
-    if grid_span is not None:
-        return int(grid_span.get(f"{{{_NS}}}val"))
-    return 1
-
-
-def _dedupe_row_cells(row) -> list[tuple]:
-    """Get deduplicated cells from a row with their grid positions.
+def _dedupe_row_cells(tr) -> list[tuple]:
+    """Get deduplicated cells from a ``<w:tr>`` row with their grid positions.
 
     Returns list of (cell_text, col_start, col_end) tuples.
     col_start is 0-indexed, col_end is exclusive.
 
-    python-docx's row.cells returns one entry per grid column position,
-    repeating the same cell object for merged columns. We use enumerate
-    to track the actual column index.
+    Walks the row's ``<w:tc>`` elements once, advancing a grid-column
+    cursor by each cell's ``gridSpan`` so that merged columns yield a
+    single entry.
 
     Cells that are vertical-merge continuations (vMerge without
     val="restart") are emitted with empty text so that column positions
     remain correct while the content is not double-counted.
     """
-    # Build a set of grid-column ranges that are vMerge continuations
-    # by inspecting the raw XML <w:tc> elements in this row's <w:tr>.
-    # python-docx's row.cells resolves merged cells to the original,
-    # so we cannot compare tc element identity; we use column positions.
-    tr = row._tr
-    continuation_cols: set[int] = set()
+    result = []
     col_cursor = 0
-    for tc_el in tr.findall(f"{{{_NS}}}tc"):
-        tc_pr = tc_el.find(f"{{{_NS}}}tcPr")
+    for tc_el in tr.iterfind(_W_TC):
         gs = 1
         is_continuation = False
+        tc_pr = tc_el.find(_W_TC_PR)
         if tc_pr is not None:
-            gs_el = tc_pr.find(f"{{{_NS}}}gridSpan")
-            if gs_el is not None:
-                gs = int(gs_el.get(f"{{{_NS}}}val"))
-            vm_el = tc_pr.find(f"{{{_NS}}}vMerge")
-            if vm_el is not None:
-                val = vm_el.get(f"{{{_NS}}}val")
-                if val != "restart":
-                    is_continuation = True
-        if is_continuation:
-            for i in range(col_cursor, col_cursor + gs):
-                continuation_cols.add(i)
-        col_cursor += gs
-
-    result = []
-    row_seen = set()
-
-    for col_pos, cell in enumerate(row.cells):
-        tc_id = id(cell._tc)
-        if tc_id in row_seen:
-            continue
-        row_seen.add(tc_id)
-
-        span = _get_grid_span(cell)
+            # One pass over tcPr's children picks up both properties
+            for prop in tc_pr:
+                tag = prop.tag
+                if tag == _W_GRID_SPAN:
+                    gs = int(prop.get(_W_VAL))
+                elif tag == _W_V_MERGE:
+                    is_continuation = prop.get(_W_VAL) != "restart"
 
         # Emit empty text for vMerge continuation cells
-        if col_pos in continuation_cols:
-            result.append(("", col_pos, col_pos + span))
-        else:
-            text = _get_cell_text(cell)
-            result.append((text, col_pos, col_pos + span))
+        text = "" if is_continuation else _get_tc_text(tc_el)
+        result.append((text, col_cursor, col_cursor + gs))
+        col_cursor += gs
 
     return result
 
 
-def _is_break_row(cells: list[tuple]) -> bool:
-    """Check if this row is a break (coffee/lunch).
-
-    Real break rows span the entire table (1-2 cells).  Data rows may
-    mention 'break' inside schedule content but have many more cells.
-    """
-    if not cells or len(cells) > 3:
-        return False
-    full_text = " ".join(c[0] for c in cells).lower()
-    return "break" in full_text or "coffee" in full_text or "lunch" in full_text
-
+_BREAK_ROW_KEYWORDS = ("break", "coffee", "lunch")
+_FOOTER_ROW_KEYWORDS = ("all sessions end", "no exceptions")
 
-def _is_footer_row(cells: list[tuple]) -> bool:
-    """Check if this row is the end-of-day footer."""
-    if not cells or len(cells) > 3:
-        return False
-    full_text = " ".join(c[0] for c in cells).lower()
-    return "all sessions end" in full_text or "no exceptions" in full_text
 
+def _classify_row(cells: list[tuple]) -> str:
+    """Classify a table row as 'break', 'footer', 'meta' or 'data'.
 
-def _is_metadata_row(cells: list[tuple]) -> bool:
-    """Check if this row contains room metadata."""
+    Break (coffee/lunch), end-of-day footer and room-metadata rows span
+    the entire table (1-3 cells).  Data rows may mention 'break' inside
+    schedule content but have many more cells, so they are never
+    classified by text.
+    """
     if not cells or len(cells) > 3:
-        return False
-    full_text = " ".join(c[0] for c in cells).lower()
-    return "meeting rooms" in full_text
+        return "data"
+    if len(cells) == 1:
+        full_text = cells[0][0].lower()
+    else:
+        full_text = " ".join(c[0] for c in cells).lower()
+    if any(kw in full_text for kw in _BREAK_ROW_KEYWORDS):
+        return "break"
+    if any(kw in full_text for kw in _FOOTER_ROW_KEYWORDS):
+        return "footer"
+    if "meeting rooms" in full_text:
+        return "meta"
+    return "data"
 
 
 def _parse_day_header(cells: list[tuple]) -> dict[str, tuple[int, int]]:
@@ -205,22 +251,25 @@ def _parse_day_header(cells: list[tuple]) -> dict[str, tuple[int, int]]:
     day_map = {}
     for text, col_start, col_end in cells:
         # Normalize day name
-        for day in DAY_ORDER:
-            if day.lower() in text.lower():
+        text_lower = text.lower()
+        for day, day_lower in _DAY_NAMES_LOWER:
+            if day_lower in text_lower:
                 if day not in day_map:
                     day_map[day] = (col_start, col_end)
                 break
     return day_map
 
 
+@lru_cache(maxsize=256)
 def _parse_room_code(line: str) -> str:
     """Extract a short room code from a line like 'RAN1_Off#1 (J1)' → 'J1'.
 
     Tries the last parenthesised token first (e.g. '(J1)').  If none found,
-    falls back to the whole line.
+    falls back to the whole line.  Memoized: the same room lines recur in
+    every document of a meeting.
     """
     # Find all parenthesised groups
-    matches = re.findall(r"\(([^)]+)\)", line)
+    matches = _PAREN_RE.findall(line)
     if matches:
         # Use the last match – it's usually the room code
         # e.g. "Main session (F1/2/3, Level 2)" → "F1/2/3, Level 2" → take part before comma
@@ -243,6 +292,20 @@ def _normalize_color(color: str | None) -> str | None:
     return None
 
 
+@lru_cache(maxsize=256)
+def _hex_to_rgb(color: str) -> tuple[int, int, int] | None:
+    """Split a normalised hex colour into its (r, g, b) channels.
+
+    Cached: a document only uses a handful of colours, but they are
+    compared against each other many times.  Returns None if the string
+    is not valid hex.
+    """
+    try:
+        return int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16)
+    except ValueError:
+        return None
+
+
 def _colors_match(c1: str, c2: str, tolerance: int = 8) -> bool:
     """Check if two hex colors are close enough to be considered the same.
 
@@ -251,36 +314,45 @@ def _colors_match(c1: str, c2: str, tolerance: int = 8) -> bool:
     """
     if c1 == c2:
         return True
-    try:
-        r1, g1, b1 = int(c1[0:2], 16), int(c1[2:4], 16), int(c1[4:6], 16)
-        r2, g2, b2 = int(c2[0:2], 16), int(c2[2:4], 16), int(c2[4:6], 16)
-        return (
-            abs(r1 - r2) <= tolerance
-            and abs(g1 - g2) <= tolerance
-            and abs(b1 - b2) <= tolerance
-        )
-    except (ValueError, IndexError):
+    rgb1 = _hex_to_rgb(c1)
+    rgb2 = _hex_to_rgb(c2)
+    if rgb1 is None or rgb2 is None:
         return False
+    r1, g1, b1 = rgb1
+    r2, g2, b2 = rgb2
+    return (
+        abs(r1 - r2) <= tolerance
+        and abs(g1 - g2) <= tolerance
+        and abs(b1 - b2) <= tolerance
+    )
 
 
-def _extract_textbox_rooms(doc: Document) -> list[dict]:
+def _extract_textbox_rooms(body) -> list[dict]:
     """Extract room labels from TextBox shapes in the document.
 
     Each TextBox that sits above a table acts as a room column header.
     Returns list of dicts: {'name': str, 'color': str | None}.
     Color is the fill/background colour of the shape (normalised hex).
     """
-    body = doc.element.body
-    alt_contents = body.findall(f'.//{{{_MC_NS}}}AlternateContent')
+    alt_contents = body.findall(f'.//{_MC_ALTERNATE_CONTENT}')
 
     results: list[dict] = []
     for ac in alt_contents:
-        # Collect text from <w:t> inside the AlternateContent
+        # One walk over the AlternateContent collects the <w:t> text, the
+        # first VML fillcolor and the DrawingML shape properties.
         texts = []
-        from lxml import etree  # noqa: local import
-        for t_el in ac.iter(f'{{{_NS}}}t'):
-            if t_el.text:
-                texts.append(t_el.text)
+        vml_fill: str | None = None
+        sp_prs = []
+        for el in ac.iter():
+            tag = el.tag
+            if tag == _W_T:
+                if el.text:
+                    texts.append(el.text)
+            elif tag == _V_SHAPE:
+                if vml_fill is None:
+                    vml_fill = el.get('fillcolor') or None
+            elif tag == _WPS_SP_PR:
+                sp_prs.append(el)
         raw = ''.join(texts).strip()
         if not raw:
             continue
@@ -296,19 +368,15 @@ def _extract_textbox_rooms(doc: Document) -> list[dict]:
         fill_color: str | None = None
 
         # 1) Try VML fillcolor attribute (most reliable resolved value)
-        for shape in ac.iter(f'{{{_V_NS}}}shape'):
-            fc = shape.get('fillcolor')
-            if fc:
-                # VML may include " [id]" suffix, e.g. '#ffd966 [1943]'
-                fc = fc.split()[0]
-                fill_color = _normalize_color(fc)
-                break
+        if vml_fill is not None:
+            # VML may include " [id]" suffix, e.g. '#ffd966 [1943]'
+            fill_color = _normalize_color(vml_fill.split()[0])
 
         # 2) Fallback: DrawingML a:solidFill > a:srgbClr (skip font colors)
         if fill_color is None:
-            for sp_pr in ac.iter(f'{{{_WPS_NS}}}spPr'):
-                for solid in sp_pr.iter(f'{{{_A_NS}}}solidFill'):
-                    srgb = solid.find(f'{{{_A_NS}}}srgbClr')
+            for sp_pr in sp_prs:
+                for solid in sp_pr.iter(_A_SOLID_FILL):
+                    srgb = solid.find(_A_SRGB_CLR)
                     if srgb is not None:
                         fill_color = _normalize_color(srgb.get('val'))
                         break
@@ -321,7 +389,8 @@ def _extract_textbox_rooms(doc: Document) -> list[dict]:
 
 
 def _get_table_column_colors(
-    table, day_columns: dict[str, tuple[int, int]],
+    tbl, rows: list[list[tuple]],
+    day_columns: dict[str, tuple[int, int]],
     actual_rooms: dict[str, int],
 ) -> list[str]:
     """Collect the ordered set of distinct room colours used in a table.
@@ -331,29 +400,24 @@ def _get_table_column_colors(
     colours in column order.  This avoids picking up colours from merged
     cells or empty-day cells.
 
+    ``rows`` are the table's deduplicated rows (see ``_table_rows``); their
+    grid positions are reused so each ``<w:tc>`` only has its shading read.
+
     Returns an ordered list of unique colour hex strings, one per room.
     """
     valid_ranges = list(day_columns.items())
 
-    for row in table.rows[1:]:
-        tr = row._tr
-
-        # Build (col_start, col_end, fill) for every tc in this row
+    trs = tbl.findall(_W_TR)
+    for tr, cells in zip(trs[1:], rows[1:]):
+        # Pair each tc's (col_start, col_end) with its fill colour
         tc_info: list[tuple[int, int, str | None]] = []
-        col_cursor = 0
-        for tc_el in tr.findall(f'{{{_NS}}}tc'):
-            tc_pr = tc_el.find(f'{{{_NS}}}tcPr')
-            gs = 1
+        for tc_el, (_, cs, ce) in zip(tr.iterfind(_W_TC), cells):
             fill = None
-            if tc_pr is not None:
-                gs_el = tc_pr.find(f'{{{_NS}}}gridSpan')
-                if gs_el is not None:
-                    gs = int(gs_el.get(f'{{{_NS}}}val'))
-                shd = tc_pr.find(f'{{{_NS}}}shd')
-                if shd is not None:
-                    fill = _normalize_color(shd.get(f'{{{_NS}}}fill'))
-            tc_info.append((col_cursor, col_cursor + gs, fill))
-            col_cursor += gs
+            tc_pr = tc_el.find(_W_TC_PR)
+            shd = tc_pr.find(_W_SHD) if tc_pr is not None else None
+            if shd is not None:
+                fill = _normalize_color(shd.get(_W_FILL))
+            tc_info.append((cs, ce, fill))
 
         # For each day, collect room-cell colours if cell count matches
         for day_name, (day_cs, day_ce) in valid_ranges:
@@ -367,19 +431,14 @@ def _get_table_column_colors(
                     day_fills.append(fill or 'FFFFFF')
 
             if len(day_fills) == expected:
-                # De-dup while preserving order
-                seen: set[str] = set()
+                # One cell per room, so every colour must be distinct:
+                # give up on this day at the first repeat
                 ordered: list[str] = []
                 for f in day_fills:
-                    canon = None
-                    for s in seen:
-                        if _colors_match(f, s):
-                            canon = s
-                            break
-                    if canon is None:
-                        seen.add(f)
-                        ordered.append(f)
-                if len(ordered) == expected:
+                    if any(_colors_match(f, s) for s in ordered):
+                        break
+                    ordered.append(f)
+                else:
                     return ordered
 
     return []
@@ -387,7 +446,8 @@ def _get_table_column_colors(
 
 def _match_rooms_to_table(
     textbox_rooms: list[dict],
-    table,
+    tbl,
+    rows: list[list[tuple]],
     day_columns: dict[str, tuple[int, int]],
     actual_rooms: dict[str, int],
 ) -> list[str] | None:
@@ -400,7 +460,7 @@ def _match_rooms_to_table(
         return None
 
     unique_table_colors = _get_table_column_colors(
-        table, day_columns, actual_rooms,
+        tbl, rows, day_columns, actual_rooms,
     )
     if not unique_table_colors:
         return None
@@ -423,17 +483,19 @@ def _match_rooms_to_table(
 
 
 def _extract_room_names_from_doc(
-    doc: Document,
+    table_rows: list[list[list[tuple]]],
 ) -> tuple[list[str] | None, list[str] | None]:
     """Extract online and offline room names from document metadata rows.
 
     Fallback used when TextBox colour matching is not available.
+    ``table_rows`` holds the deduplicated rows (see ``_table_rows``) of
+    the document tables whose text mentions "meeting rooms", in document
+    order.
 
     Returns (online_rooms, offline_rooms) – either may be None.
     """
-    for table in doc.tables:
-        for row in table.rows:
-            cells = _dedupe_row_cells(row)
+    for rows in table_rows:
+        for cells in rows:
             for text, _, _ in cells:
                 if "meeting rooms" not in text.lower():
                     continue
@@ -471,36 +533,35 @@ def _extract_room_names_from_doc(
     return None, None
 
 
-def _get_table_preceding_paragraphs(doc: Document) -> dict[int, str]:
-    """Map each table index (in doc.tables order) to preceding paragraph text.
+def _get_table_preceding_paragraphs(body) -> dict[int, str]:
+    """Map each body-level table index to its preceding paragraph text.
 
     Walks through the document body elements in order, collecting paragraph
     text until a table is encountered.  The collected text is associated
     with that table's index.
 
     Returns:
-        dict mapping table index (0-based, matching doc.tables) to the
+        dict mapping table index (0-based, body-level tables) to the
         concatenated text of all paragraphs between the previous table
         (or document start) and this table.
     """
-    body = doc.element.body
     table_contexts: dict[int, str] = {}
     current_paragraphs: list[str] = []
     table_idx = 0
 
     for child in body:
-        tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
+        tag = child.tag
 
-        if tag == 'p':
+        if tag == _W_P:
             # Extract text from paragraph XML element
             texts = []
-            for t_el in child.iter(f'{{{_NS}}}t'):
+            for t_el in child.iter(_W_T):
                 if t_el.text:
                     texts.append(t_el.text)
             text = ''.join(texts).strip()
             if text:
                 current_paragraphs.append(text)
-        elif tag == 'tbl':
+        elif tag == _W_TBL:
             context = '\n'.join(current_paragraphs) if current_paragraphs else ''
             table_contexts[table_idx] = context
             current_paragraphs = []  # Reset for next table
@@ -509,58 +570,82 @@ def _get_table_preceding_paragraphs(doc: Document) -> dict[int, str]:
     return table_contexts
 
 
-def _is_schedule_table(table) -> bool:
-    """Determine if a table is a schedule table (has day headers)."""
-    if len(table.rows) < 5:
+def _table_rows(tbl) -> list[list[tuple]]:
+    """Deduplicate every ``<w:tr>`` row of a table (see ``_dedupe_row_cells``)."""
+    return [_dedupe_row_cells(tr) for tr in tbl.iterfind(_W_TR)]
+
+
+def _may_be_schedule_table(tbl) -> bool:
+    """Cheap pre-scan of a raw ``<w:tbl>`` before ``_is_schedule_table``.
+
+    Checks the row count and searches the first row's raw text for a day
+    name without decomposing any cells.  Never rejects a table that
+    ``_is_schedule_table`` would accept.
+    """
+    trs = tbl.findall(_W_TR)
+    if len(trs) < 5:
         return False
-    first_row = _dedupe_row_cells(table.rows[0])
-    text = " ".join(c[0] for c in first_row).lower()
-    return any(day.lower() in text for day in DAY_ORDER)
+    return _DAY_NAME_RE.search("".join(trs[0].itertext())) is not None
 
 
-def _count_actual_rooms_per_day(
-    table, day_columns: dict[str, tuple[int, int]]
-) -> dict[str, int]:
-    """Determine the actual number of rooms per day by examining data rows.
+def _is_schedule_table(rows: list[list[tuple]]) -> bool:
+    """Determine if a table is a schedule table (has day headers).
 
-    The DOCX grid may allocate more columns for a day than there are real
-    rooms (extra columns are used for flexible cell merging).  The true
-    room count equals the maximum number of distinct cells observed in any
-    single data row for that day.
+    ``rows`` are the table's deduplicated row cells.
     """
-    max_cells: dict[str, int] = {day: 1 for day in day_columns}
-
-    for row in table.rows[1:]:
-        cells = _dedupe_row_cells(row)
-        if (
-            _is_break_row(cells)
-            or _is_footer_row(cells)
-            or _is_metadata_row(cells)
-        ):
-            continue
-        if not cells:
-            continue
-        if _determine_time_block_index(cells[0][0]) is None:
-            continue
+    if len(rows) < 5:
+        return False
+    first_row = rows[0]
+    text = " ".join(c[0] for c in first_row).lower()
+    return any(day_lower in text for _, day_lower in _DAY_NAMES_LOWER)
 
-        for day, (day_col_start, day_col_end) in day_columns.items():
-            count = sum(
-                1
-                for _, cs, ce in cells[1:]
-                if cs >= day_col_start and ce <= day_col_end
-            )
-            if count > max_cells[day]:
-                max_cells[day] = count
 
-    return max_cells
+def _day_column_lookup(
+    day_columns: dict[str, tuple[int, int]],
+) -> list[str | None]:
+    """Map every grid column to the day whose header range covers it."""
+    col_to_day: list[str | None] = [None] * max(
+        (col_end for _, col_end in day_columns.values()), default=0
+    )
+    for day, (col_start, col_end) in day_columns.items():
+        for col in range(col_start, col_end):
+            col_to_day[col] = day
+    return col_to_day
+
+
+def _cells_by_day(
+    cells: list[tuple],
+    day_columns: dict[str, tuple[int, int]],
+    col_to_day: list[str | None],
+) -> dict[str, list[tuple]]:
+    """Bucket a row's cells by day in one pass (see ``_day_column_lookup``).
+
+    A cell belongs to a day when it starts and ends within that day's
+    column range; cells straddling two days belong to neither.  Buckets
+    keep the row's left-to-right column order.
+    """
+    by_day: dict[str, list[tuple]] = {day: [] for day in day_columns}
+    n_cols = len(col_to_day)
+    for cell in cells:
+        col_start, col_end = cell[1], cell[2]
+        if col_start >= n_cols:
+            continue
+        day = col_to_day[col_start]
+        if day is not None and col_end <= day_columns[day][1]:
+            by_day[day].append(cell)
+    return by_day
 
 
+@lru_cache(maxsize=256)
 def _determine_time_block_index(time_text: str) -> int | None:
-    """Match a time label cell to a time block index."""
+    """Match a time label cell to a time block index.
+
+    Memoized: the same handful of time labels repeat on every table.
+    """
     # Extract start time from text like "08:30\n~\n10:30\n\n(120 min)".
     # Some schedules split the first morning block into later-starting rows
     # such as "09:00 ~ 10:30"; these should still map into TB0.
-    match = re.search(r"(\d{1,2}:\d{2})", time_text)
+    match = _TIME_RE.search(time_text)
     if not match:
         return None
 
@@ -593,30 +678,50 @@ def parse_docx(
         - cells: list of CellData for each non-empty schedule cell
         - tables_meta: list of dicts with table metadata (rooms per day)
     """
-    doc = Document(str(filepath))
+    body = _read_document_body(filepath)
+    tables = body.findall(_W_TBL)
+
+    # Only tables that can hold a schedule or room metadata are decomposed
+    # into rows (once each; the helpers below share the result).  Appendix
+    # and summary tables are rejected on their raw text alone, and only
+    # tables whose raw text mentions "meeting rooms" are searched for
+    # room metadata.
+    table_rows: dict[int, list[list[tuple]]] = {}
+    meta_table_rows: list[list[list[tuple]]] = []
+    for idx, tbl in enumerate(tables):
+        has_meta = "meeting rooms" in "".join(tbl.itertext()).lower()
+        if has_meta or _may_be_schedule_table(tbl):
+            rows = table_rows[idx] = _table_rows(tbl)
+            if has_meta:
+                meta_table_rows.append(rows)
 
     # ── Context extraction ───────────────────────────────────────
     # Map each table to the paragraph text preceding it.
-    table_contexts = _get_table_preceding_paragraphs(doc)
+    table_contexts = _get_table_preceding_paragraphs(body)
 
     # ── Room name extraction ────────────────────────────────────
     # Primary: TextBox colour matching (most robust).
     # Fallback: metadata row parsing.
-    textbox_rooms = _extract_textbox_rooms(doc)
-    online_room_names_fb, offline_room_names_fb = _extract_room_names_from_doc(doc)
+    textbox_rooms = _extract_textbox_rooms(body)
+    online_room_names_fb, offline_room_names_fb = _extract_room_names_from_doc(
+        meta_table_rows
+    )
 
     # Find all schedule tables
     schedule_tables = []
-    for idx, table in enumerate(doc.tables):
-        if _is_schedule_table(table):
-            schedule_tables.append((idx, table))
+    for idx, rows in table_rows.items():
+        if _is_schedule_table(rows):
+            schedule_tables.append((idx, tables[idx], rows))
 
     if not schedule_tables:
         raise ValueError("No schedule tables found in the document")
 
     # If more tables than limit, take the N largest (by column count)
     if max_tables is not None and len(schedule_tables) > max_tables:
-        schedule_tables.sort(key=lambda x: len(x[1].columns), reverse=True)
+        schedule_tables.sort(
+            key=lambda x: len(x[1].findall(f"{_W_TBLGRID}/{_W_GRIDCOL}")),
+            reverse=True,
+        )
         schedule_tables = schedule_tables[:max_tables]
         # Re-sort by original index
         schedule_tables.sort(key=lambda x: x[0])
@@ -624,26 +729,46 @@ def parse_docx(
     all_cells = []
     tables_meta = []
 
-    for table_idx, (orig_idx, table) in enumerate(schedule_tables):
-        rows = table.rows
+    for table_idx, (orig_idx, tbl, rows) in enumerate(schedule_tables):
         if len(rows) < 2:
             continue
 
         # Parse header row for day -> column mapping
-        header_cells = _dedupe_row_cells(rows[0])
-        day_columns = _parse_day_header(header_cells)
+        day_columns = _parse_day_header(rows[0])
 
         if not day_columns:
             continue
 
-        # Determine actual rooms per day (header span may exceed real rooms)
-        actual_rooms = _count_actual_rooms_per_day(table, day_columns)
+        # Single pass over the data rows: keep timed rows with their cells
+        # bucketed by day, and determine the actual rooms per day.  The
+        # DOCX grid may allocate more columns for a day than there are
+        # real rooms (extra columns are used for flexible cell merging);
+        # the true room count equals the maximum number of distinct cells
+        # observed in any single data row for that day.
+        col_to_day = _day_column_lookup(day_columns)
+        actual_rooms: dict[str, int] = {day: 1 for day in day_columns}
+        timed_rows: list[tuple[int, dict[str, list[tuple]]]] = []
+        for row_cells in rows[1:]:
+            # Break/footer/metadata rows are skipped
+            if not row_cells or _classify_row(row_cells) != "data":
+                continue
+
+            # First cell should be the time label
+            tb_index = _determine_time_block_index(row_cells[0][0])
+            if tb_index is None:
+                continue
+
+            by_day = _cells_by_day(row_cells[1:], day_columns, col_to_day)
+            for day, day_cells in by_day.items():
+                if len(day_cells) > actual_rooms[day]:
+                    actual_rooms[day] = len(day_cells)
+            timed_rows.append((tb_index, by_day))
 
         day_rooms: dict[str, list[str]] = {}
 
         # Try colour-based TextBox matching first
         color_matched = _match_rooms_to_table(
-            textbox_rooms, table, day_columns, actual_rooms,
+            textbox_rooms, tbl, rows, day_columns, actual_rooms,
         )
 
         for day, (col_start, col_end) in day_columns.items():
@@ -669,23 +794,8 @@ def parse_docx(
             }
         )
 
-        # Parse data rows
-        for row_idx in range(1, len(rows)):
-            row_cells = _dedupe_row_cells(rows[row_idx])
-
-            if _is_break_row(row_cells) or _is_footer_row(row_cells) or _is_metadata_row(row_cells):
-                continue
-
-            # First cell should be the time label
-            if not row_cells:
-                continue
-
-            time_cell_text = row_cells[0][0]
-            tb_index = _determine_time_block_index(time_cell_text)
-
-            if tb_index is None:
-                continue
-
+        # Emit cells from the buffered rows
+        for tb_index, by_day in timed_rows:
             time_block = TIME_BLOCKS[tb_index]
 
             # Process cells grouped by day with ordinal room mapping
@@ -693,15 +803,8 @@ def parse_docx(
                 grid_cols = day_col_end - day_col_start
                 num_actual = actual_rooms[day]
 
-                # Collect cells for this day, sorted by column position
-                day_data_cells = sorted(
-                    [
-                        (t, cs, ce)
-                        for t, cs, ce in row_cells[1:]
-                        if cs >= day_col_start and ce <= day_col_end
-                    ],
-                    key=lambda x: x[1],
-                )
+                # Cells for this day, already in column order
+                day_data_cells = by_day[day]
 
                 if not day_data_cells:
                     continue
@@ -740,9 +843,9 @@ def parse_docx(
                         day=day,
                         room_indices=room_indices,
                         time_block_index=tb_index,
-                        time_block_start=time_block["start"],
-                        time_block_end=time_block["end"],
-                        time_block_duration=time_block["duration"],
+                        time_block_start=time_block.start,
+                        time_block_end=time_block.end,
+                        time_block_duration=time_block.duration,
                         table_index=table_idx,
                     )
                     all_cells.append(cell_data)
@@ -754,38 +857,51 @@ def build_room_list(tables_meta: list[dict]) -> dict[str, list[RoomInfo]]:
     """Build a unified room list per day from all tables.
 
     Returns dict: day_name -> list of RoomInfo (in order for grid columns).
+    Room names are interned: the same few names recur across every day
+    and table, and are later used as dict/set keys and compared per cell.
     """
     day_rooms: dict[str, list[RoomInfo]] = {}
 
     for meta in tables_meta:
+        table_index = meta["table_index"]
         for day, rooms in meta["day_rooms"].items():
-            if day not in day_rooms:
-                day_rooms[day] = []
-            for ri, room_name in enumerate(rooms):
-                day_rooms[day].append(
-                    RoomInfo(
-                        name=room_name,
-                        table_index=meta["table_index"],
-                        room_index_in_table=ri,
-                    )
-                )
+            day_rooms.setdefault(day, []).extend(
+                RoomInfo(sys.intern(room_name), table_index, ri)
+                for ri, room_name in enumerate(rooms)
+            )
 
     return day_rooms
 
 
+def build_room_index(day_rooms: list[RoomInfo]) -> dict[tuple[int, int], int]:
+    """Map (table_index, room_index_in_table) to a room's position in ``day_rooms``."""
+    return {
+        (r.table_index, r.room_index_in_table): global_idx
+        for global_idx, r in enumerate(day_rooms)
+    }
+
+
 def compute_room_global_col(
     cell: CellData,
     day_rooms: list[RoomInfo],
+    room_index: dict[tuple[int, int], int] | None = None,
 ) -> tuple[int, int]:
     """Compute global grid column range for a cell's rooms.
 
+    Pass ``room_index`` (from ``build_room_index(day_rooms)``) when
+    placing many cells of the same day to avoid rebuilding it per cell.
+
     Returns (col_start, col_end) as 1-indexed grid columns
     (col 1 = time label, col 2 = first room).
     """
-    matching_indices = []
-    for global_idx, room_info in enumerate(day_rooms):
-        if room_info.table_index == cell.table_index and room_info.room_index_in_table in cell.room_indices:
-            matching_indices.append(global_idx)
+    if room_index is None:
+        room_index = build_room_index(day_rooms)
+
+    matching_indices = [
+        room_index[cell.table_index, ri]
+        for ri in cell.room_indices
+        if (cell.table_index, ri) in room_index
+    ]
 
     if not matching_indices:
         return (2, 3)  # fallback: first room
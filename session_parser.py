@@ -13,6 +13,19 @@ from models import RoomInfo, Session, time_to_minutes, minutes_to_time
 
 CACHE_DIR = Path(".cache")
 ROOM_DETECT_PROMPT_VERSION = 2
+GEMINI_MODEL = "gemini-3-flash-preview"
+# Concurrent Gemini calls when parsing uncached time slots
+SLOT_PARSE_WORKERS = 8
+# Extra retries for rate-limited (HTTP 429) time-slot calls, backing off
+# exponentially from RATE_LIMIT_BACKOFF_SECONDS with random jitter so the
+# concurrent workers do not retry in lockstep
+RATE_LIMIT_RETRIES = 5
+RATE_LIMIT_BACKOFF_SECONDS = 5
+
+# Leading agenda item in a session name, e.g. "AI 9.1.2 Topic" / ".9.1 Topic"
+_AGENDA_PREFIX_RE = re.compile(r"^(?:AI\s+)?\.?\s*(\d+\.\d[\d.xX]*)\s*(.*)")
+# Agenda item in a group header, e.g. "AI 9.1 ..."
+_AI_HEADER_RE = re.compile(r"AI\s+(\d[\d.]*)")
 
 # ── JSON Schemas for structured output ───────────────────────────
 
@@ -126,8 +139,16 @@ def _save_cache(key: str, data: list[dict]):
     """Save Gemini results to cache."""
     CACHE_DIR.mkdir(exist_ok=True)
     cache_file = CACHE_DIR / f"{key}.json"
-    with open(cache_file, "w") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # Write a sibling temp file and swap it in, so a reader (or an
+    # interrupted run) never sees a half-written entry
+    tmp_file = cache_file.with_name(f".{cache_file.name}.tmp")
+    try:
+        with open(tmp_file, "w") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, cache_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
 
 
 def get_timezone_from_location(location_text: str) -> str | None:
@@ -169,7 +190,7 @@ Return ONLY valid JSON: {{"timezone": "IANA/Timezone", "city": "CityName", "coun
 
     try:
         response = client.models.generate_content(
-            model="gemini-3-flash-preview",
+            model=GEMINI_MODEL,
             contents=prompt,
             config=types.GenerateContentConfig(
                 temperature=0.0,
@@ -197,6 +218,7 @@ def detect_room_from_context(
     available_rooms: list[str],
     num_rooms_needed: int = 1,
     room_hints: dict | None = None,
+    messages: list[str] | None = None,
 ) -> list[str] | None:
     """Use Gemini to determine which room(s) a schedule table belongs to.
 
@@ -216,6 +238,8 @@ def detect_room_from_context(
                 "main_room": "...",
                 "breakout_rooms": [...],
             }
+        messages: If given, progress lines are appended here instead of
+            printed, so concurrent callers can print them in order.
 
     Returns:
         List of room names from available_rooms, or None if detection fails.
@@ -227,6 +251,8 @@ def detect_room_from_context(
     if not api_key:
         return None
 
+    emit = print if messages is None else messages.append
+
     # Ensure deterministic room order (preserve caller order)
     available_rooms = _ordered_unique(available_rooms)
 
@@ -237,6 +263,7 @@ def detect_room_from_context(
     cache_input = json.dumps(
         {
             "v": ROOM_DETECT_PROMPT_VERSION,
+            "model": GEMINI_MODEL,
             "context_text": context_text,
             "available_rooms": available_rooms,
             "num_rooms_needed": num_rooms_needed,
@@ -250,7 +277,7 @@ def detect_room_from_context(
     if cached is not None:
         names = cached.get("room_names", [])
         if names:
-            print(f"  Room detection (cached): {names}")
+            emit(f"  Room detection (cached): {names}")
             return names
 
     # Fast deterministic pass before LLM (meeting-agnostic + role hints)
@@ -262,7 +289,7 @@ def detect_room_from_context(
     )
     if heuristic_names and len(heuristic_names) == num_rooms_needed:
         _save_cache(f"room_{cache_key}", {"room_names": heuristic_names})
-        print(f"  Room detection (heuristic): {heuristic_names}")
+        emit(f"  Room detection (heuristic): {heuristic_names}")
         return heuristic_names
 
     from google import genai
@@ -282,7 +309,7 @@ def detect_room_from_context(
 
     try:
         response = client.models.generate_content(
-            model="gemini-3-flash-preview",
+            model=GEMINI_MODEL,
             contents=prompt,
             config=types.GenerateContentConfig(
                 temperature=0.2,
@@ -300,9 +327,9 @@ def detect_room_from_context(
             _save_cache(f"room_{cache_key}", {"room_names": valid_names})
             reasoning = result.get("reasoning", "")
             context_preview = context_text[:80].replace('\n', ' ')
-            print(f"  Room detection: '{context_preview}' → {valid_names}")
+            emit(f"  Room detection: '{context_preview}' → {valid_names}")
             if reasoning:
-                print(f"    Reasoning: {reasoning}")
+                emit(f"    Reasoning: {reasoning}")
             return valid_names
         elif valid_names:
             # Partial match — combine with deterministic hints if possible
@@ -312,7 +339,7 @@ def detect_room_from_context(
                 _save_cache(f"room_{cache_key}", {"room_names": combined})
                 return combined
     except Exception as e:
-        print(f"  Warning: Room detection LLM call failed: {e}")
+        emit(f"  Warning: Room detection LLM call failed: {e}")
 
     if heuristic_names:
         fallback = heuristic_names[:num_rooms_needed]
@@ -826,10 +853,16 @@ def _build_time_slot_prompt(
 
 
 def _time_slot_cache_key(slot) -> str:
-    """Generate a cache key for a time slot's combined data."""
+    """Generate a cache key for a time slot's combined data.
+
+    Covers the model and system instruction as well as the slot data, so
+    prompt or model changes never reuse stale responses.
+    """
     content = json.dumps(
         {
             "v": _PROMPT_VERSION,
+            "model": GEMINI_MODEL,
+            "system": MULTI_SOURCE_SYSTEM_INSTRUCTION,
             "day": slot.day,
             "tb": slot.time_block_index,
             "rooms": [r.name for r in slot.main_rooms],
@@ -846,13 +879,69 @@ def _time_slot_cache_key(slot) -> str:
     return hashlib.sha256(content.encode()).hexdigest()[:16]
 
 
+def _is_rate_limited(error: Exception) -> bool:
+    """Whether a Gemini API error is an HTTP 429 (quota / rate limit)."""
+    return getattr(error, "code", None) == 429
+
+
+def _request_time_slot(client, user_prompt: str, slot_label: str) -> dict | None:
+    """Run one multi-source Gemini call with retries (runs in a worker thread).
+
+    Rate-limited calls get up to RATE_LIMIT_RETRIES jittered exponential
+    backoffs of their own; other errors are retried MAX_RETRIES times.
+    Returns the parsed JSON result, or None if every attempt failed.
+    """
+    import random
+    import time as _time
+    from google.genai import types
+
+    MAX_RETRIES = 3
+    attempt = 0
+    rate_limited = 0
+    while True:
+        try:
+            response = client.models.generate_content(
+                model=GEMINI_MODEL,
+                contents=user_prompt,
+                config=types.GenerateContentConfig(
+                    system_instruction=MULTI_SOURCE_SYSTEM_INSTRUCTION,
+                    temperature=0.1,
+                    response_mime_type="application/json",
+                    response_json_schema=MULTI_SOURCE_SESSION_SCHEMA,
+                    thinking_config=types.ThinkingConfig(thinking_level="minimal"),
+                ),
+            )
+            return json.loads(response.text.strip())
+        except Exception as e:
+            if _is_rate_limited(e) and rate_limited < RATE_LIMIT_RETRIES:
+                wait = RATE_LIMIT_BACKOFF_SECONDS * 2 ** rate_limited
+                wait = random.uniform(wait / 2, wait)
+                rate_limited += 1
+                print(
+                    f"  {slot_label}: rate limited, retry({rate_limited}, wait {wait:.0f}s)...",
+                    flush=True,
+                )
+                _time.sleep(wait)
+                continue
+            attempt += 1
+            if attempt < MAX_RETRIES:
+                wait = 5 * attempt
+                print(f"  {slot_label}: retry({attempt}, wait {wait}s)...", flush=True)
+                _time.sleep(wait)
+            else:
+                print(f"  {slot_label}: FAILED: {e}", flush=True)
+                return None
+
+
 def parse_time_slots(
     time_slots: list,
     day_rooms_map: dict[str, list[RoomInfo]],
 ) -> list[Session]:
     """Parse all time slots into Session objects using multi-source Gemini calls.
 
-    One Gemini call per time slot with all source data combined.
+    One Gemini call per time slot with all source data combined.  Uncached
+    slots are sent concurrently, at most SLOT_PARSE_WORKERS at a time;
+    sessions are returned in time-slot order regardless of completion order.
 
     Args:
         time_slots: list of TimeSlotData from merger.collect_time_slot_data()
@@ -861,9 +950,8 @@ def parse_time_slots(
     Returns:
         List of Session objects with calculated start/end times.
     """
-    import time as _time
+    from concurrent.futures import ThreadPoolExecutor, as_completed
     from google import genai
-    from google.genai import types
 
     api_key = os.environ.get("GEMINI_API_KEY")
     if not api_key:
@@ -874,82 +962,69 @@ def parse_time_slots(
         http_options={"timeout": 120_000},
     )
 
-    all_sessions: list[Session] = []
+    slot_sessions: list[list[Session]] = [[] for _ in time_slots]
+    # (slot_idx, slot_label, cache_key, alias_to_name, user_prompt)
+    pending: list[tuple[int, str, str, dict[str, str], str]] = []
     cache_hits = 0
-    api_calls = 0
-    MAX_RETRIES = 3
 
     for slot_idx, slot in enumerate(time_slots):
         slot_label = f"{slot.day} TB{slot.time_block_index} ({slot.time_block_start}-{slot.time_block_end})"
+        day_rooms = day_rooms_map.get(slot.day, [])
 
         # Check cache
         ck = _time_slot_cache_key(slot)
         cached = _load_cache(f"slot_{ck}")
         if cached is not None:
             # Convert cached result to sessions
-            day_rooms = day_rooms_map.get(slot.day, [])
             _, alias_to_name = build_room_aliases(day_rooms)
-            sessions = _slot_result_to_sessions(cached, slot, day_rooms_map, alias_to_name)
-            all_sessions.extend(sessions)
+            slot_sessions[slot_idx] = _slot_result_to_sessions(
+                cached, slot, day_rooms_map, alias_to_name,
+            )
             cache_hits += 1
             continue
 
         # Build prompt with room aliases
-        day_rooms = day_rooms_map.get(slot.day, [])
         name_to_alias, alias_to_name = build_room_aliases(day_rooms)
         user_prompt = _build_time_slot_prompt(slot, name_to_alias)
-        n_sources = len(slot.sources)
-        n_entries = sum(len(s.entries) for s in slot.sources)
-        print(
-            f"  [{slot_idx+1}/{len(time_slots)}] {slot_label} "
-            f"({n_sources} sources, {n_entries} entries)...",
-            end=" ", flush=True,
-        )
-
-        # Rate limit
-        if api_calls > 0:
-            _time.sleep(1.0)
+        pending.append((slot_idx, slot_label, ck, alias_to_name, user_prompt))
+
+    if pending:
+        with ThreadPoolExecutor(
+            max_workers=min(len(pending), SLOT_PARSE_WORKERS),
+        ) as pool:
+            futures = {
+                pool.submit(
+                    _request_time_slot, client, user_prompt, slot_label,
+                ): (slot_idx, slot_label, ck, alias_to_name)
+                for slot_idx, slot_label, ck, alias_to_name, user_prompt in pending
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                slot_idx, slot_label, ck, alias_to_name = futures[future]
+                slot = time_slots[slot_idx]
+                parsed_result = future.result()
 
-        # Call Gemini
-        parsed_result = None
-        for attempt in range(MAX_RETRIES):
-            try:
-                response = client.models.generate_content(
-                    model="gemini-3-flash-preview",
-                    contents=user_prompt,
-                    config=types.GenerateContentConfig(
-                        system_instruction=MULTI_SOURCE_SYSTEM_INSTRUCTION,
-                        temperature=0.1,
-                        response_mime_type="application/json",
-                        response_json_schema=MULTI_SOURCE_SESSION_SCHEMA,
-                        thinking_config=types.ThinkingConfig(thinking_level="minimal"),
-                    ),
-                )
-                parsed_result = json.loads(response.text.strip())
-                break
-            except Exception as e:
-                if attempt < MAX_RETRIES - 1:
-                    wait = 5 * (attempt + 1)
-                    print(f"retry({attempt+1}, wait {wait}s)...", end=" ", flush=True)
-                    _time.sleep(wait)
-                else:
-                    print(f"FAILED: {e}")
+                if parsed_result is None:
+                    # Not cached, so the next run retries this slot
                     parsed_result = {"sessions": []}
+                else:
+                    _save_cache(f"slot_{ck}", parsed_result)
 
-        api_calls += 1
-
-        if parsed_result is None:
-            parsed_result = {"sessions": []}
-
-        # Cache the result
-        _save_cache(f"slot_{ck}", parsed_result)
-
-        # Convert to sessions
-        sessions = _slot_result_to_sessions(parsed_result, slot, day_rooms_map, alias_to_name)
-        all_sessions.extend(sessions)
+                # Convert to sessions
+                sessions = _slot_result_to_sessions(
+                    parsed_result, slot, day_rooms_map, alias_to_name,
+                )
+                slot_sessions[slot_idx] = sessions
+
+                n_sources = len(slot.sources)
+                n_entries = sum(len(s.entries) for s in slot.sources)
+                print(
+                    f"  [{done}/{len(pending)}] {slot_label} "
+                    f"({n_sources} sources, {n_entries} entries)... "
+                    f"{len(sessions)} sessions",
+                    flush=True,
+                )
 
-        n_sessions = len(sessions)
-        print(f"{n_sessions} sessions")
+    all_sessions = [s for sessions in slot_sessions for s in sessions]
 
     if cache_hits:
         print(f"  ({cache_hits} time slots from cache)")
@@ -1001,7 +1076,7 @@ def _slot_result_to_sessions(
 
             # Post-process: extract agenda_item from name if not provided
             if not agenda_item:
-                agenda_match = re.match(r"^(?:AI\s+)?\.?\s*(\d+\.\d[\d.xX]*)\s*(.*)", name)
+                agenda_match = _AGENDA_PREFIX_RE.match(name)
                 if agenda_match:
                     agenda_item = agenda_match.group(1).strip(".")
                     rest = agenda_match.group(2).strip()
@@ -1009,7 +1084,7 @@ def _slot_result_to_sessions(
                         name = rest
                 # Check group_header for agenda context
                 if not agenda_item and group_header:
-                    m = re.match(r"AI\s+(\d[\d.]*)", group_header)
+                    m = _AI_HEADER_RE.match(group_header)
                     if m:
                         agenda_item = m.group(1).strip(".")
 
@@ -1054,6 +1129,35 @@ def normalize_group_headers(sessions: list[Session]) -> list[Session]:
     Returns:
         The same list with group_header values replaced.
     """
+    mapping = _group_header_mapping(sessions)
+    if mapping:
+        for session in sessions:
+            if session.group_header and session.group_header in mapping:
+                session.group_header = mapping[session.group_header]
+    return sessions
+
+
+def normalize_and_fill_groups(sessions: list[Session]) -> list[Session]:
+    """Normalize group headers and fill missing ones in a single sweep.
+
+    Equivalent to ``fill_missing_groups(normalize_group_headers(sessions))``
+    but applies the normalization mapping while collecting the fill
+    lookups, so the session list is traversed twice instead of five times.
+
+    Args:
+        sessions: List of Session objects (modified in-place).
+
+    Returns:
+        The same list with group_header values normalized and filled.
+    """
+    return _fill_groups(sessions, _group_header_mapping(sessions))
+
+
+def _group_header_mapping(sessions: list[Session]) -> dict[str, str]:
+    """Get the LLM group_header simplification mapping for ``sessions``.
+
+    Returns an empty dict when normalization is skipped or fails.
+    """
     import time as _time
     from google import genai
     from google.genai import types
@@ -1062,12 +1166,19 @@ def normalize_group_headers(sessions: list[Session]) -> list[Session]:
 
     if len(unique_headers) <= 1:
         print(f"Group normalization: {len(unique_headers)} unique group(s), skipping.")
-        return sessions
+        return {}
 
     print(f"\nNormalizing group headers ({len(unique_headers)} unique)...")
 
-    # Cache key from sorted unique headers
-    cache_content = json.dumps(unique_headers, sort_keys=True)
+    # Cache key from model, instruction and sorted unique headers
+    cache_content = json.dumps(
+        {
+            "model": GEMINI_MODEL,
+            "system": GROUP_SIMPLIFY_SYSTEM_INSTRUCTION,
+            "headers": unique_headers,
+        },
+        sort_keys=True,
+    )
     cache_hash = hashlib.sha256(cache_content.encode()).hexdigest()[:16]
     cache_key = f"group_map_{cache_hash}"
 
@@ -1083,7 +1194,7 @@ def normalize_group_headers(sessions: list[Session]) -> list[Session]:
         api_key = os.environ.get("GEMINI_API_KEY")
         if not api_key:
             print("  Warning: GEMINI_API_KEY not set, skipping normalization")
-            return sessions
+            return {}
 
         client = genai.Client(
             api_key=api_key,
@@ -1101,7 +1212,7 @@ def normalize_group_headers(sessions: list[Session]) -> list[Session]:
         for attempt in range(MAX_RETRIES):
             try:
                 response = client.models.generate_content(
-                    model="gemini-3-flash-preview",
+                    model=GEMINI_MODEL,
                     contents=user_prompt,
                     config=types.GenerateContentConfig(
                         system_instruction=GROUP_SIMPLIFY_SYSTEM_INSTRUCTION,
@@ -1119,10 +1230,10 @@ def normalize_group_headers(sessions: list[Session]) -> list[Session]:
                     _time.sleep(wait)
                 else:
                     print(f"  Group normalization failed: {e}")
-                    return sessions
+                    return {}
 
         if result is None:
-            return sessions
+            return {}
 
         _save_cache(cache_key, result)
 
@@ -1139,12 +1250,7 @@ def normalize_group_headers(sessions: list[Session]) -> list[Session]:
     else:
         print("  All groups already normalized.")
 
-    # Apply mapping in-place
-    for session in sessions:
-        if session.group_header and session.group_header in mapping:
-            session.group_header = mapping[session.group_header]
-
-    return sessions
+    return mapping
 
 
 def fill_missing_groups(sessions: list[Session]) -> list[Session]:
@@ -1162,38 +1268,60 @@ def fill_missing_groups(sessions: list[Session]) -> list[Session]:
     Returns:
         The same list with missing group_header values filled where possible.
     """
+    return _fill_groups(sessions, {})
+
+
+def _fill_groups(
+    sessions: list[Session], mapping: dict[str, str],
+) -> list[Session]:
+    """Apply a group_header ``mapping`` then fill missing groups (in-place).
+
+    The first sweep renames headers and collects the name → group lookup
+    and the set of known groups; the second fills empty headers (see
+    ``fill_missing_groups``).  Name matching only copies groups that
+    already exist, so the known-group set is final after the first sweep.
+    """
     # Collect name → group mapping from sessions that have groups
     name_to_group: dict[str, str] = {}
+    groups: set[str] = set()
     for s in sessions:
-        if s.group_header and s.name not in name_to_group:
-            name_to_group[s.name] = s.group_header
-
-    # Pass 1: match by identical session name
-    filled_by_name = 0
-    for s in sessions:
-        if not s.group_header and s.name in name_to_group:
-            s.group_header = name_to_group[s.name]
-            filled_by_name += 1
+        group = s.group_header
+        if not group:
+            continue
+        if group in mapping:
+            group = s.group_header = mapping[group]
+            if not group:
+                continue
+        groups.add(group)
+        if s.name not in name_to_group:
+            name_to_group[s.name] = group
 
-    # Collect all known groups (after pass 1)
     known_groups = sorted(
-        set(s.group_header for s in sessions if s.group_header),
+        groups,
         key=len,
         reverse=True,  # longest first for most-specific matching
     )
 
-    # Pass 2: match by group name substring in session name
+    # Match by identical session name, then by group name substring
+    filled_by_name = 0
     filled_by_substring = 0
+    total_missing = 0
     for s in sessions:
-        if not s.group_header:
-            name_lower = s.name.lower()
-            for group in known_groups:
-                if group.lower() in name_lower:
-                    s.group_header = group
-                    filled_by_substring += 1
-                    break
-
-    total_missing = sum(1 for s in sessions if not s.group_header)
+        if s.group_header:
+            continue
+        if s.name in name_to_group:
+            s.group_header = name_to_group[s.name]
+            filled_by_name += 1
+            continue
+        name_lower = s.name.lower()
+        for group in known_groups:
+            if group.lower() in name_lower:
+                s.group_header = group
+                filled_by_substring += 1
+                break
+        else:
+            total_missing += 1
+
     if filled_by_name or filled_by_substring:
         print(
             f"  Fill missing groups: {filled_by_name} by name, "
@@ -1,6 +1,8 @@
 """Tests for downloader meeting-ID extraction and schedule selection."""
 
 import json
+import os
+import tempfile
 import unittest
 from datetime import datetime
 from pathlib import Path
@@ -12,6 +14,7 @@ from downloader import (
     _pick_latest_in_meeting_group,
     find_latest_chair_notes,
     find_latest_schedule,
+    find_local_latest_schedule,
     get_latest_chair_notes_info,
     load_schedule_state,
     save_schedule_state,
@@ -378,5 +381,37 @@ class SaveScheduleStateTests(unittest.TestCase):
             p.unlink(missing_ok=True)
 
 
+class FindLocalLatestScheduleTests(unittest.TestCase):
+    """Tests for find_local_latest_schedule (local mtime-based selection)."""
+
+    @staticmethod
+    def _touch(directory: Path, name: str, mtime: float) -> Path:
+        p = directory / name
+        p.write_bytes(b"")
+        os.utime(p, (mtime, mtime))
+        return p
+
+    def test_returns_none_for_missing_directory(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            missing = Path(tmpdir) / "missing"
+            self.assertIsNone(find_local_latest_schedule(missing))
+
+    def test_newest_schedule_wins(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            d = Path(tmpdir)
+            self._touch(d, "schedule v1.docx", 1000)
+            newest = self._touch(d, "schedule v2.pdf", 2000)
+            self._touch(d, "notes.docx", 3000)
+            self.assertEqual(find_local_latest_schedule(d), newest)
+
+    def test_docx_wins_mtime_tie(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            d = Path(tmpdir)
+            self._touch(d, "schedule.pdf", 1000)
+            self._touch(d, "schedule.pptx", 1000)
+            docx = self._touch(d, "schedule.docx", 1000)
+            self.assertEqual(find_local_latest_schedule(d), docx)
+
+
 if __name__ == "__main__":
     unittest.main()
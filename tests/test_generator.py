@@ -0,0 +1,110 @@
+import json
+import re
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from generator import generate_html, save_html
+from models import DaySchedule, RoomInfo, Schedule, Session, time_to_minutes
+
+
+def _session(name, start, end, col, group="", ai=None):
+    return Session(
+        name=name,
+        duration_minutes=time_to_minutes(end) - time_to_minutes(start),
+        start_time=start,
+        end_time=end,
+        day="Monday",
+        room_col_start=col,
+        room_col_end=col + 1,
+        agenda_item=ai,
+        group_header=group,
+    )
+
+
+class FilterDataFormatTests(unittest.TestCase):
+    """The page script expands filter-data and block-data by position."""
+
+    def setUp(self):
+        sessions = [
+            _session("AI/ML", "08:30", "09:30", 2, "R20", "9.1.2, 9.1.1"),
+            _session("AI/ML", "09:30", "10:00", 2, "R20"),
+            _session("Opening", "08:30", "09:00", 3),
+            _session("NTN", "11:00", "12:00", 3, "R19", "10"),
+        ]
+        schedule = Schedule(
+            meeting_name="RAN1#124",
+            days=[
+                DaySchedule(
+                    day_name="Monday",
+                    rooms=[RoomInfo("F1", 0, 0), RoomInfo("F2", 0, 1)],
+                    sessions=sessions,
+                )
+            ],
+            source_file="schedule.docx",
+            generated_at="2026-01-01 00:00",
+            contact_name="Contact",
+            contact_email="contact@example.com",
+        )
+        self.html = generate_html(schedule)
+
+    def _script_json(self, element_id):
+        match = re.search(
+            rf'<script type="application/json" id="{element_id}">(.*?)</script>',
+            self.html,
+        )
+        return json.loads(match.group(1))
+
+    def test_filter_data_is_positional(self):
+        # [allAIs, [[group_header, [[session_name, [ai_id, ...], hasNoAI], ...]], ...]]
+        self.assertEqual(
+            self._script_json("filter-data"),
+            [
+                ["9.1.1", "9.1.2", "10"],
+                [
+                    ["R19", [["NTN", [2], 0]]],
+                    ["R20", [["AI/ML", [0, 1], 1]]],
+                    ["", [["Opening", [], 0]]],
+                ],
+            ],
+        )
+
+    def test_block_data_holds_session_id_and_hex_ai_mask(self):
+        # Session ids follow the flattened group order above
+        # (NTN=0, AI/ML=1, Opening=2); mask bit i is allAIs[i].
+        self.assertEqual(
+            self._script_json("block-data"),
+            [[1, "3"], [1, "0"], [2, "0"], [0, "4"]],
+        )
+        self.assertEqual(self.html.count('class="session-block'), 4)
+
+
+class SaveHtmlTests(unittest.TestCase):
+    def test_writes_generated_page(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out = Path(tmpdir) / "docs" / "index.html"
+            with patch("generator._iter_html", return_value=iter(["<html>", "</html>"])):
+                save_html(object(), out)
+            self.assertEqual(out.read_text(encoding="utf-8"), "<html></html>")
+            self.assertEqual(list(out.parent.iterdir()), [out])
+
+    def test_failed_generation_keeps_previous_page(self):
+        def failing_page(schedule):
+            yield "<html>"
+            raise RuntimeError("boom")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out = Path(tmpdir) / "index.html"
+            out.write_text("previous page", encoding="utf-8")
+
+            with patch("generator._iter_html", side_effect=failing_page):
+                with self.assertRaises(RuntimeError):
+                    save_html(object(), out)
+
+            self.assertEqual(out.read_text(encoding="utf-8"), "previous page")
+            self.assertEqual(list(out.parent.iterdir()), [out])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -30,8 +30,7 @@ class ExtractMeetingNameTests(unittest.TestCase):
 
 class MainChairNotesLookupTests(unittest.TestCase):
     @patch("main.save_html", return_value="docs/index.html")
-    @patch("main.fill_missing_groups", side_effect=lambda sessions: sessions)
-    @patch("main.normalize_group_headers", side_effect=lambda sessions: sessions)
+    @patch("main.normalize_and_fill_groups", side_effect=lambda sessions: sessions)
     @patch("main.parse_time_slots", return_value=[])
     @patch("main.collect_time_slot_data", return_value=[])
     @patch("main.build_room_list", return_value={})
@@ -60,8 +59,7 @@ class MainChairNotesLookupTests(unittest.TestCase):
         mock_build_room_list,
         mock_collect_time_slot_data,
         mock_parse_time_slots,
-        mock_normalize_group_headers,
-        mock_fill_missing_groups,
+        mock_normalize_and_fill_groups,
         mock_save_html,
     ):
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -0,0 +1,70 @@
+import contextlib
+import io
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from merger import _resolve_vc_room_names
+from models import RoomInfo
+
+
+MAIN_ROOMS = {"Monday": [RoomInfo("Main", 0, 0), RoomInfo("Brk1", 0, 1)]}
+
+
+def _vc_table(index: int, context: str, rooms: list[str]) -> dict:
+    return {
+        "table_index": index,
+        "context_text": context,
+        "day_rooms": {"Monday": list(rooms), "Tuesday": list(rooms)},
+    }
+
+
+class ResolveVcRoomNamesTests(unittest.TestCase):
+    """Concurrent room detection: one call per context, logs in table order."""
+
+    def test_shared_contexts_and_ordered_logs(self):
+        calls = []
+        lock = threading.Lock()
+
+        def fake_detect(context_text, available_rooms, num_rooms_needed=1,
+                        room_hints=None, messages=None):
+            with lock:
+                calls.append((context_text, num_rooms_needed))
+            # Finish the first table's call last so unordered output would show
+            time.sleep(0.05 if context_text == "main room" else 0)
+            messages.append(f"  detect {context_text}")
+            return ["Main"] if context_text == "main room" else ["Brk1"]
+
+        vc_meta = [
+            _vc_table(0, "main room", ["Room A"]),
+            _vc_table(1, "breakout", ["Room A"]),
+            _vc_table(2, "main room", ["Room A"]),
+            _vc_table(3, "", ["Room A"]),
+            _vc_table(4, "named", ["Brk1"]),
+        ]
+        out = io.StringIO()
+        with patch("session_parser.detect_room_from_context", fake_detect), \
+                contextlib.redirect_stdout(out):
+            _resolve_vc_room_names(vc_meta, MAIN_ROOMS)
+
+        self.assertEqual(sorted(calls), [("breakout", 1), ("main room", 1)])
+        self.assertEqual(
+            [m["day_rooms"]["Tuesday"] for m in vc_meta],
+            [["Main"], ["Brk1"], ["Main"], ["Room A"], ["Brk1"]],
+        )
+        lines = [line.strip() for line in out.getvalue().splitlines()]
+        self.assertEqual(
+            [line for line in lines if not line.startswith("Warning")],
+            [
+                "detect main room",
+                "Resolved table 0 rooms: ['Room A'] → ['Main']",
+                "detect breakout",
+                "Resolved table 1 rooms: ['Room A'] → ['Brk1']",
+                "Resolved table 2 rooms: ['Room A'] → ['Main']",
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,18 @@
+import tempfile
 import unittest
+import zipfile
+from pathlib import Path
 from xml.etree.ElementTree import Element, SubElement
 from unittest.mock import MagicMock
 
-from parser import _determine_time_block_index, _get_cell_text
+from docx import Document
+
+from parser import (
+    _determine_time_block_index,
+    _get_cell_text,
+    _read_document_body,
+    parse_docx,
+)
 
 _NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
 
@@ -100,5 +110,171 @@ class DetermineTimeBlockIndexTests(unittest.TestCase):
         )
 
 
+def _write_text_docx(path):
+    doc = Document()
+    doc.add_paragraph("main part text")
+    doc.save(path)
+    return path
+
+
+def _body_text(path):
+    return "".join(_read_document_body(path).itertext())
+
+
+class ReadDocumentBodyTests(unittest.TestCase):
+    def test_reads_default_main_part(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = _write_text_docx(Path(tmpdir) / "doc.docx")
+            self.assertIn("main part text", _body_text(path))
+
+    def test_follows_office_document_relationship(self):
+        """A main part not named word/document.xml is found via _rels/.rels."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = _write_text_docx(Path(tmpdir) / "doc.docx")
+            renamed = Path(tmpdir) / "renamed.docx"
+            with zipfile.ZipFile(path) as src, zipfile.ZipFile(renamed, "w") as dst:
+                for item in src.infolist():
+                    data = src.read(item.filename)
+                    name = item.filename
+                    if name == "word/document.xml":
+                        name = "word/document2.xml"
+                    elif name == "word/_rels/document.xml.rels":
+                        name = "word/_rels/document2.xml.rels"
+                    elif name in ("_rels/.rels", "[Content_Types].xml"):
+                        data = data.replace(b"/document.xml", b"/document2.xml")
+                    dst.writestr(name, data)
+
+            self.assertIn("main part text", _body_text(renamed))
+
+
+def _add_schedule_table(doc, rooms_per_day):
+    """Add a Monday/Tuesday schedule table with *rooms_per_day* columns per day.
+
+    Rows: header, TB0 (one cell per room), coffee break, TB1 (Monday cell
+    spanning every room, Tuesday room 0 vertically merged into TB2), TB2,
+    end-of-day footer and an in-table "Meeting Rooms" note.
+    """
+    n = rooms_per_day
+    tbl = doc.add_table(rows=7, cols=1 + 2 * n)
+    rows = tbl.rows
+
+    def span(row, first, last, text):
+        cell = rows[row].cells[first]
+        if last != first:
+            cell = cell.merge(rows[row].cells[last])
+        cell.text = text
+        return cell
+
+    span(0, 0, 0, "Time")
+    span(0, 1, n, "Monday")
+    span(0, n + 1, 2 * n, "Tuesday Feb 10")
+
+    span(1, 0, 0, "08:30 ~ 10:30")
+    for day, base in (("M", 1), ("T", n + 1)):
+        for i in range(n):
+            span(1, base + i, base + i, f"{day}0-{i}")
+
+    span(2, 0, 2 * n, "Coffee break")
+
+    span(3, 0, 0, "11:00 ~ 13:00")
+    span(3, 1, n, "M1-all")
+    tbl.cell(3, n + 1).merge(tbl.cell(4, n + 1)).text = "T1-0 long"
+    for i in range(1, n):
+        span(3, n + 1 + i, n + 1 + i, f"T1-{i}")
+
+    span(4, 0, 0, "14:30 ~ 16:30")
+    span(4, 1, 1, "M2-0")
+    for i in range(1, n):
+        span(4, n + 1 + i, n + 1 + i, f"T2-{i}")
+
+    span(5, 0, 2 * n, "All sessions end at 19:30, no exceptions")
+    span(6, 0, 2 * n, "Meeting Rooms: see the list above")
+    return tbl
+
+
+def _cell_summary(cells):
+    return [
+        (c.text, c.day, c.room_indices, c.time_block_index, c.table_index)
+        for c in cells
+    ]
+
+
+def _parse_schedule_docx(max_tables):
+    """Write a two-table schedule DOCX to a temp dir and parse it."""
+    doc = Document()
+    meta = doc.add_table(rows=1, cols=1).cell(0, 0)
+    meta.text = "Online Meeting Rooms"
+    meta.add_paragraph("RAN1_Main (F1)")
+    meta.add_paragraph("RAN1_Brk (F2)")
+    doc.add_paragraph("Online schedule")
+    _add_schedule_table(doc, rooms_per_day=2)
+    doc.add_paragraph("Offline schedule")
+    _add_schedule_table(doc, rooms_per_day=3)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "schedule.docx"
+        doc.save(path)
+        return parse_docx(path, max_tables=max_tables)
+
+
+class ParseDocxTests(unittest.TestCase):
+    def test_extracts_cells_with_spans_merges_and_skipped_rows(self):
+        cells, tables_meta = _parse_schedule_docx(max_tables=None)
+
+        table0 = [c for c in cells if c.table_index == 0]
+        self.assertEqual(
+            _cell_summary(table0),
+            [
+                ("M0-0", "Monday", [0], 0, 0),
+                ("M0-1", "Monday", [1], 0, 0),
+                ("T0-0", "Tuesday", [0], 0, 0),
+                ("T0-1", "Tuesday", [1], 0, 0),
+                # gridSpan across both Monday rooms
+                ("M1-all", "Monday", [0, 1], 1, 0),
+                ("T1-0 long", "Tuesday", [0], 1, 0),
+                ("T1-1", "Tuesday", [1], 1, 0),
+                # the empty Monday room and the vMerge continuation of
+                # "T1-0 long" keep their columns but emit no cell
+                ("M2-0", "Monday", [0], 2, 0),
+                ("T2-1", "Tuesday", [1], 2, 0),
+            ],
+        )
+        first = table0[0]
+        self.assertEqual(
+            (first.time_block_start, first.time_block_end, first.time_block_duration),
+            ("08:30", "10:30", 120),
+        )
+
+        self.assertEqual([m["table_index"] for m in tables_meta], [0, 1])
+        self.assertEqual(tables_meta[0]["context_text"], "Online schedule")
+        self.assertEqual(
+            tables_meta[0]["day_rooms"], {"Monday": ["F1", "F2"], "Tuesday": ["F1", "F2"]}
+        )
+        self.assertEqual(
+            tables_meta[1]["day_rooms"]["Monday"], ["Offline A", "Offline B", "Offline C"]
+        )
+
+    def test_break_footer_and_meta_rows_produce_no_cells(self):
+        cells, _ = _parse_schedule_docx(max_tables=None)
+        texts = {c.text for c in cells}
+        self.assertNotIn("Coffee break", texts)
+        self.assertNotIn("All sessions end at 19:30, no exceptions", texts)
+        self.assertNotIn("Meeting Rooms: see the list above", texts)
+
+    def test_max_tables_keeps_widest_tables(self):
+        cells, tables_meta = _parse_schedule_docx(max_tables=1)
+
+        self.assertEqual(len(tables_meta), 1)
+        self.assertEqual(tables_meta[0]["context_text"], "Offline schedule")
+        # Three rooms per day, more than the two listed room names
+        self.assertEqual(
+            tables_meta[0]["day_rooms"]["Monday"], ["Room A", "Room B", "Room C"]
+        )
+        self.assertEqual(
+            [(c.text, c.room_indices) for c in cells if c.time_block_index == 1],
+            [("M1-all", [0, 1, 2]), ("T1-0 long", [0]), ("T1-1", [1]), ("T1-2", [2])],
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
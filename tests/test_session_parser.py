@@ -0,0 +1,181 @@
+import contextlib
+import copy
+import io
+import json
+import random
+import sys
+import types
+import unittest
+from unittest.mock import MagicMock, patch
+
+from models import Session
+from session_parser import (
+    fill_missing_groups,
+    normalize_and_fill_groups,
+    normalize_group_headers,
+)
+
+
+def _s(name: str, group: str = "") -> Session:
+    return Session(
+        name=name,
+        duration_minutes=30,
+        start_time="08:30",
+        end_time="09:00",
+        day="Monday",
+        room_col_start=2,
+        room_col_end=3,
+        group_header=group,
+    )
+
+
+def _reference_fill_missing_groups(sessions: list[Session]) -> list[Session]:
+    """fill_missing_groups as it was before the fused sweep (two passes)."""
+    name_to_group: dict[str, str] = {}
+    for s in sessions:
+        if s.group_header and s.name not in name_to_group:
+            name_to_group[s.name] = s.group_header
+
+    filled_by_name = 0
+    for s in sessions:
+        if not s.group_header and s.name in name_to_group:
+            s.group_header = name_to_group[s.name]
+            filled_by_name += 1
+
+    known_groups = sorted(
+        set(s.group_header for s in sessions if s.group_header),
+        key=len,
+        reverse=True,
+    )
+
+    filled_by_substring = 0
+    for s in sessions:
+        if not s.group_header:
+            name_lower = s.name.lower()
+            for group in known_groups:
+                if group.lower() in name_lower:
+                    s.group_header = group
+                    filled_by_substring += 1
+                    break
+
+    total_missing = sum(1 for s in sessions if not s.group_header)
+    if filled_by_name or filled_by_substring:
+        print(
+            f"  Fill missing groups: {filled_by_name} by name, "
+            f"{filled_by_substring} by substring"
+            + (f" ({total_missing} still empty)" if total_missing else "")
+        )
+    elif total_missing:
+        print(f"  Fill missing groups: {total_missing} sessions have no group")
+
+    return sessions
+
+
+def _fake_genai(mapping: dict[str, str]) -> dict[str, types.ModuleType]:
+    """``sys.modules`` entries for a google.genai whose model returns *mapping*."""
+    response = MagicMock()
+    response.text = json.dumps({
+        "mappings": [
+            {"original": k, "simplified": v} for k, v in mapping.items()
+        ],
+    })
+    genai = types.ModuleType("google.genai")
+    genai.Client = MagicMock()
+    genai.Client.return_value.models.generate_content.return_value = response
+    genai.types = MagicMock()
+    google = types.ModuleType("google")
+    google.genai = genai
+    return {"google": google, "google.genai": genai, "google.genai.types": genai.types}
+
+
+class NormalizeAndFillGroupsTests(unittest.TestCase):
+    """normalize_and_fill_groups must match the two-step path it replaced.
+
+    Only the Gemini client and the cache are stubbed: both paths run the real
+    mapping lookup, and the two-step path fills with the pre-fusion
+    fill_missing_groups.
+    """
+
+    MAPPING = {
+        "Rel-20 NR (6GR)": "6GR",
+        "NR Rel-20 6GR": "6GR",
+        "Maintenance of Rel-19": "R19 Maint",
+        "Misc.": "",  # normalised away: filled again like a missing group
+        "NTN": "NTN",
+    }
+
+    def _both_paths(self, sessions, mapping=None):
+        mapping = self.MAPPING if mapping is None else mapping
+        one_step = copy.deepcopy(sessions)
+        two_step = copy.deepcopy(sessions)
+        current = copy.deepcopy(sessions)
+        one_log, two_log = io.StringIO(), io.StringIO()
+        with patch.dict(sys.modules, _fake_genai(mapping)), \
+                patch.dict("os.environ", {"GEMINI_API_KEY": "test"}), \
+                patch("session_parser._load_cache", return_value=None), \
+                patch("session_parser._save_cache"):
+            with contextlib.redirect_stdout(one_log):
+                normalize_and_fill_groups(one_step)
+            with contextlib.redirect_stdout(two_log):
+                _reference_fill_missing_groups(normalize_group_headers(two_step))
+            with contextlib.redirect_stdout(io.StringIO()):
+                fill_missing_groups(normalize_group_headers(current))
+        self.assertEqual(one_log.getvalue(), two_log.getvalue())
+        self.assertEqual(
+            [s.group_header for s in current], [s.group_header for s in two_step]
+        )
+        return (
+            [s.group_header for s in one_step],
+            [s.group_header for s in two_step],
+        )
+
+    def test_llm_mapped_headers(self):
+        one_step, two_step = self._both_paths([
+            _s("AI/ML", "Rel-20 NR (6GR)"),
+            _s("CSI", "NR Rel-20 6GR"),
+            _s("MIMO", "Maintenance of Rel-19"),
+            _s("Unmapped", "Other label"),
+        ])
+        self.assertEqual(one_step, ["6GR", "6GR", "R19 Maint", "Other label"])
+        self.assertEqual(one_step, two_step)
+
+    def test_empty_header_filled_by_exact_name(self):
+        one_step, two_step = self._both_paths([
+            _s("AI/ML", "Rel-20 NR (6GR)"),
+            _s("AI/ML"),
+            _s("Wrap-up", "Misc."),
+            _s("Wrap-up"),
+        ])
+        # The name match copies the normalised group
+        self.assertEqual(one_step, ["6GR", "6GR", "", ""])
+        self.assertEqual(one_step, two_step)
+
+    def test_empty_header_filled_by_longest_substring(self):
+        one_step, two_step = self._both_paths([
+            _s("Plenary", "NTN"),
+            _s("Opening", "R19 Maint"),
+            _s("NTN and R19 Maint discussion"),
+            _s("ntn-ish offline"),
+            _s("Nothing matches"),
+        ])
+        self.assertEqual(
+            one_step, ["NTN", "R19 Maint", "R19 Maint", "NTN", ""]
+        )
+        self.assertEqual(one_step, two_step)
+
+    def test_randomized_session_lists(self):
+        rng = random.Random(1234)
+        names = ["AI/ML", "CSI", "NTN session", "6GR wrap-up", "R19 Maint", "Misc", "x"]
+        headers = list(self.MAPPING) + ["", "", "6GR", "Other label"]
+        for _ in range(200):
+            sessions = [
+                _s(rng.choice(names), rng.choice(headers))
+                for _ in range(rng.randint(0, 12))
+            ]
+            mapping = self.MAPPING if rng.random() < 0.8 else {}
+            one_step, two_step = self._both_paths(sessions, mapping)
+            self.assertEqual(one_step, two_step)
+
+
+if __name__ == "__main__":
+    unittest.main()